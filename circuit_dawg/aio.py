@@ -0,0 +1,118 @@
+"""
+asyncio front end for the DAWG classes.
+
+``AsyncDAWG`` wraps a loaded DAWG and runs every query in an executor so
+disk reads and long traversals never block the event loop. Completion
+iterators hand over keys in batches, giving control back to the loop
+between them, and concurrent identical requests share a single lookup.
+"""
+
+import asyncio
+import threading
+from itertools import islice
+
+from . import wrapper
+
+DEFAULT_BATCH_SIZE = 256
+
+# Pointers that keep no shared file position and may be read from many
+# threads at once.
+_THREAD_SAFE_POINTERS = (
+    wrapper.BufferPointer,
+    wrapper.PreadPointer,
+    wrapper.ArrayPointer,
+)
+
+
+class AsyncDAWG:
+    """
+    Async wrapper around a loaded ``dawg``. Queries run on ``executor``
+    (the loop's default executor if None); with the seek/read ``"file"``
+    backend they are serialized so threads can't race on the file position.
+    """
+
+    def __init__(self, dawg, executor=None, batch_size=DEFAULT_BATCH_SIZE):
+        self.dawg = dawg
+        self.executor = executor
+        self.batch_size = batch_size
+        self._inflight = {}
+        if isinstance(dawg.dct.fp, _THREAD_SAFE_POINTERS):
+            self._lock = None
+        else:
+            self._lock = threading.Lock()
+
+    @classmethod
+    async def load(cls, dawg, path, executor=None, backend="pread", **kwargs):
+        """
+        Loads ``dawg`` from ``path`` in ``executor`` and wraps it. The
+        thread-safe ``"pread"`` backend is the default so that queries
+        can run concurrently.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            executor, lambda: dawg.load(path, backend=backend, **kwargs)
+        )
+        return cls(dawg, executor)
+
+    def _run(self, func, *args):
+        if self._lock is None:
+            return func(*args)
+        with self._lock:
+            return func(*args)
+
+    def _submit(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self.executor, self._run, func, *args)
+
+    async def _call(self, method, *args):
+        "Runs ``dawg.method(*args)``, merging concurrent identical calls."
+        key = (method,) + args
+        try:
+            future = self._inflight.get(key)
+        except TypeError:
+            # Unhashable arguments can't be merged.
+            return await self._submit(getattr(self.dawg, method), *args)
+        if future is None:
+            future = self._submit(getattr(self.dawg, method), *args)
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield() keeps one cancelled caller from cancelling the others.
+        return await asyncio.shield(future)
+
+    async def acontains(self, key):
+        return await self._call("__contains__", key)
+
+    async def aget(self, key, default=None):
+        res = await self._call("get", key, default)
+        return list(res) if isinstance(res, list) else res
+
+    async def akeys(self, prefix=""):
+        return list(await self._call("keys", prefix))
+
+    async def aitems(self, prefix=""):
+        return list(await self._call("items", prefix))
+
+    async def _aiter(self, iterator):
+        while True:
+            batch = await self._submit(lambda: list(islice(iterator, self.batch_size)))
+            if not batch:
+                return
+            for item in batch:
+                yield item
+
+    def aiterkeys(self, prefix=""):
+        "Yields the keys starting with ``prefix``, fetched in batches."
+        return self._aiter(self.dawg.iterkeys(prefix))
+
+    def aiteritems(self, prefix=""):
+        "Yields the items starting with ``prefix``, fetched in batches."
+        return self._aiter(self.dawg.iteritems(prefix))
+
+    def close(self):
+        self.dawg.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
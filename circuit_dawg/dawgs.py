@@ -1,7 +1,7 @@
 import struct
-from binascii import a2b_base64
+from binascii import a2b_base64, b2a_base64, hexlify, unhexlify
 
-from . import wrapper
+from . import patterns, wrapper
 
 
 class DAWG:
@@ -9,6 +9,11 @@ class DAWG:
     Base DAWG wrapper.
     """
 
+    # Labels that searches don't walk (see BytesDAWG).
+    _payload_separator = b""
+    # Whether keys have values (reported by find_all()).
+    _has_values = False
+
     def __init__(self):
         self.dct = None
 
@@ -18,51 +23,163 @@ class DAWG:
             key = key.encode()
         return self.dct.contains(key)
 
-    def load(self, path):
+    def load(
+        self,
+        path,
+        backend="file",
+        cache_blocks=0,
+        block_size=wrapper.DEFAULT_BLOCK_SIZE,
+    ):
         """
         Loads DAWG from a file.
+
+        ``backend`` selects how the file is read: ``"file"`` (the default)
+        streams units with seek() and read(), ``"mmap"`` memory-maps the
+        file once for much faster lookups on CPython and ``"array"`` reads
+        the whole DAWG into RAM (4 bytes per unit plus 2 bytes per guide
+        entry) for the fastest lookups. ``"pread"`` keeps streaming from the
+        file but with positional ``os.pread()`` reads; it, ``"mmap"`` and
+        ``"array"`` let one loaded DAWG be shared by many threads.
+
+        With the ``"file"`` backend, ``cache_blocks`` enables an LRU cache
+        of up to that many aligned ``block_size``-byte blocks, bounding RAM
+        while serving hot regions (such as the root) without file reads.
         """
-        self.dct = wrapper.Dictionary.load(path)
+        self.dct = wrapper.Dictionary.load(path, backend, cache_blocks, block_size)
         return self
 
-    def _has_value(self, index):
-        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
-        return self.dct.has_value(index)
-
-    def _similar_keys(self, current_prefix, key, index, replace_chars):
-        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
-        res = []
-        start_pos = len(current_prefix)
-        end_pos = len(key)
-        word_pos = start_pos
+    def read(
+        self,
+        fp,
+        backend="file",
+        cache_blocks=0,
+        block_size=wrapper.DEFAULT_BLOCK_SIZE,
+    ):
+        """
+        Loads DAWG from an open, seekable binary file object, e.g. a
+        member of a zip archive opened with ``ZipFile.open()``.
 
-        while word_pos < end_pos:
-            b_step = key[word_pos].encode("utf8")
+        See ``load`` for the supported arguments; ``"mmap"`` and ``"pread"``
+        need a real file descriptor. Closing the DAWG closes ``fp``; with
+        ``"array"``, ``fp`` is closed as soon as it has been read.
+        """
+        self.dct = wrapper.Dictionary()
+        self.dct.read(
+            fp, getattr(fp, "name", None), backend, cache_blocks, block_size
+        )
+        if backend == "array":
+            fp.close()  # Everything was copied into RAM.
+        return self
 
-            if b_step in replace_chars:
-                next_index = index
-                b_replace_char, u_replace_char = replace_chars[b_step]
+    def frombytes(self, data):
+        """
+        Loads DAWG from ``bytes``, ``bytearray``, ``memoryview`` or any
+        other buffer, without copying it.
+        """
+        self.dct = wrapper.Dictionary.frombytes(data)
+        return self
 
-                next_index = self.dct.follow_bytes(b_replace_char, next_index)
+    def tobytes(self):
+        """
+        Returns the DAWG in its binary file format, e.g. to publish it
+        with ``frombytes()`` elsewhere.
+        """
+        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
+        return self.dct.tobytes()
 
-                if next_index is not None:
-                    prefix = current_prefix + key[start_pos:word_pos] + u_replace_char
-                    extra_keys = self._similar_keys(
-                        prefix, key, next_index, replace_chars
-                    )
-                    res += extra_keys
+    def _has_value(self, index):
+        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
+        return self.dct.has_value(index)
 
-            index = self.dct.follow_bytes(b_step, index)
-            if index is None:
-                break
-            word_pos += 1
+    def _follow_many(self, b_keys, suffix=b""):
+        """
+        Returns the index reached by each of ``b_keys`` (followed by
+        ``suffix``) or None, in the order of ``b_keys``. Keys are walked in
+        sorted order so shared prefixes are followed only once.
+        """
+        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
+        if suffix:
+            b_keys = [b_key + suffix for b_key in b_keys]
+        order = sorted(range(len(b_keys)), key=b_keys.__getitem__)
+        res = [None] * len(b_keys)
+        walk = self.dct.follow_many([b_keys[i] for i in order])
+        for i, index in zip(order, walk):
+            res[i] = index
+        return res
 
-        else:
-            if self._has_value(index):
-                found_key = current_prefix + key[start_pos:]
-                res.insert(0, found_key)
+    def contains_many(self, keys):
+        """
+        Returns a list of booleans telling whether each of ``keys`` is in
+        this DAWG, in the order of ``keys``.
+        """
+        return [
+            index is not None and self._has_value(index)
+            for index in self._follow_many(_encode_keys(keys))
+        ]
 
-        return res
+    def _iter_similar(self, key, replaces):
+        """
+        Yields (variant, index) for each variant of ``key`` according to
+        ``replaces`` which is a key of this DAWG, ``key`` itself first.
+
+        A pending variant is a (prefix, position, index) entry on a stack:
+        its rest of ``key`` is followed as is, every rule matching along
+        the way pushes another variant, and variants are explored in the
+        order of the positions they branch at. Identity and deleting rules
+        can reach the same variant in several ways: the same (prefix,
+        position) is only queued once and each variant is yielded once.
+        """
+        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
+        b_chars = [char.encode("utf8") for char in key]
+        end_pos = len(key)
+        stack = [("", 0, self.dct.ROOT)]
+        queued = set()
+        found = set()
+
+        while stack:
+            current_prefix, start_pos, index = stack.pop()
+            variants = []
+            word_pos = start_pos
+
+            while word_pos < end_pos:
+                node = replaces
+                rule_pos = word_pos
+                while rule_pos < end_pos:
+                    node = node[0].get(key[rule_pos])
+                    if node is None:
+                        break
+                    rule_pos += 1
+                    for b_replace, u_replace in node[1]:
+                        next_index = self.dct.follow_bytes(b_replace, index)
+                        if next_index is not None:
+                            prefix = current_prefix + key[start_pos:word_pos] + u_replace
+                            if (prefix, rule_pos) not in queued:
+                                queued.add((prefix, rule_pos))
+                                variants.append((prefix, rule_pos, next_index))
+
+                index = self.dct.follow_bytes(b_chars[word_pos], index)
+                if index is None:
+                    break
+                word_pos += 1
+
+            else:
+                variant = current_prefix + key[start_pos:]
+                if variant not in found and self._has_value(index):
+                    found.add(variant)
+                    yield variant, index
+
+            variants.reverse()
+            stack.extend(variants)
+
+    def iter_similar_keys(self, key, replaces, limit=None):
+        """
+        Yields the variants of ``key`` in this DAWG according to
+        ``replaces``, ``key`` itself first, stopping after ``limit`` of
+        them. Variants are found lazily, so ``limit=1`` stops at the
+        first hit.
+        """
+        for found_key, _ in _take(self._iter_similar(key, replaces), limit):
+            yield found_key
 
     def similar_keys(self, key, replaces):
         """
@@ -71,23 +188,39 @@ class DAWG:
 
         ``replaces`` is an object obtained from
         ``DAWG.compile_replaces(mapping)`` where mapping is a dict
-        that maps single-char unicode sitrings to another single-char
-        unicode strings.
+        that maps unicode strings to replacement strings (or lists of
+        them), e.g. ``{"ae": "ä", "ss": "ß"}``.
 
-        This may be useful e.g. for handling single-character umlauts.
+        This may be useful e.g. for handling umlauts or transliterations.
         """
-        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
-        return self._similar_keys("", key, self.dct.ROOT, replaces)
+        return list(self.iter_similar_keys(key, replaces))
 
     @classmethod
     def compile_replaces(cls, replaces):
+        """
+        Compiles a dict of replacement rules into a trie of the strings to
+        replace, each node being a ``[children, replacements]`` list.
+        """
+        root = [{}, []]
         for k, v in replaces.items():
-            if len(k) != 1 or len(v) != 1:
-                raise ValueError("Keys and values must be single-char unicode strings.")
-
-        return dict(
-            (k.encode("utf8"), (v.encode("utf8"), v)) for k, v in replaces.items()
-        )
+            if isinstance(v, str):
+                v = [v]
+            if (
+                not isinstance(k, str)
+                or not k
+                or not isinstance(v, (list, tuple))
+                or not all(isinstance(r, str) for r in v)
+            ):
+                raise ValueError(
+                    "Keys must be non-empty unicode strings and values unicode "
+                    "strings or lists of them."
+                )
+            node = root
+            for char in k:
+                node = node[0].setdefault(char, [{}, []])
+            node[1].extend((r.encode("utf8"), r) for r in v)
+
+        return root
 
     def close(self):
         if self.dct is not None:
@@ -104,31 +237,319 @@ class DAWG:
         """
         Returns a list with keys of this DAWG that are prefixes of the ``key``.
         """
+        b_key = _encode_keys([key])[0]
+        return [b_key[:length].decode("utf8") for length, _ in self._terminals(b_key)]
+
+    def _terminals(self, b_key):
+        """
+        Yields ``(length, index)`` for each prefix of ``b_key`` which is a
+        key, in a single walk; ``index`` is where ``_value_for_index``
+        reads the value of that key.
+        """
         assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
-        res = []
         index = self.dct.ROOT
-        if not isinstance(key, bytes):
-            key = key.encode("utf8")
+        for length, label in enumerate(b_key, 1):
+            index = self.dct.follow_char(label, index)
+            if index is None:
+                return
+            value_index = self._value_index(index)
+            if value_index is not None:
+                yield length, value_index
+
+    def _value_index(self, index):
+        "Returns where the value of the key ending at ``index`` is, or None."
+        if self.dct.has_value(index):
+            return index
+        return None
+
+    def _prefix_items(self, key):
+        b_key = _encode_keys([key])[0]
+        return [
+            (b_key[:length].decode("utf8"), self._value_for_index(value_index))
+            for length, value_index in self._terminals(b_key)
+        ]
+
+    def _longest_prefix_item(self, key, default):
+        b_key = _encode_keys([key])[0]
+        last = None
+        for last in self._terminals(b_key):
+            pass
+        if last is None:
+            return default
+        length, value_index = last
+        return b_key[:length].decode("utf8"), self._value_for_index(value_index)
 
-        pos = 1
+    def find_all(self, text):
+        """
+        Returns every occurrence of a key of this DAWG in ``text`` as a
+        ``(start, end, key)`` tuple, or ``(start, end, key, value)`` for
+        DAWGs with values, ordered by start and then by length.
 
-        for ch in key:
-            index = self.dct.follow_char(ch, index)
-            if not index:
-                break
+        ``text`` is a string (offsets count characters) or ``bytes``
+        holding UTF-8 text (offsets count bytes). See ``iter_find_all``
+        for chunked input.
+        """
+        return list(self.iter_find_all(text))
 
-            if self._has_value(index):
-                res.append(key[:pos].decode("utf8"))
-            pos += 1
+    def iter_find_all(self, stream):
+        """
+        Yields the occurrences of keys like ``find_all``, reading
+        ``stream`` (a string, ``bytes`` or an iterable of either, such as a
+        file) lazily. Occurrences spanning chunk boundaries are found, and
+        memory use is bounded by the longest key.
+        """
+        for start, matches in self._prefix_walks(stream):
+            for match in matches:
+                yield self._token(start, match)
 
+    def tokenize(self, text, strategy="longest"):
+        """
+        Yields the keys of this DAWG found in ``text`` as ``(start, end,
+        key)`` tuples, or ``(start, end, key, value)`` for DAWGs with
+        values, like ``find_all``; ``start`` and ``end`` are character
+        offsets into the whole text. Text matching no key is skipped.
+
+        ``text`` is a string or an iterable of string chunks, which are
+        consumed lazily: memory use is bounded by the longest key (and,
+        for ``"min_tokens"``, by the longest ambiguous stretch of text).
+
+        ``strategy`` is one of:
+
+        * ``"longest"`` - the longest key at each position, continuing
+          after it (greedy maximal match);
+        * ``"all"`` - every key at every position, by start then length;
+        * ``"min_tokens"`` - the segmentation into the fewest tokens,
+          counting each unmatched character as a token.
+        """
+        if strategy == "longest":
+            return self._tokenize_longest(text)
+        if strategy == "all":
+            return self._tokenize_all(text)
+        if strategy == "min_tokens":
+            return self._tokenize_min_tokens(text)
+        raise ValueError(f"Unknown tokenize strategy: {strategy!r}")
+
+    def _token_value(self, index):
+        "Returns the value of the key ending at ``index``; plain DAWGs have none."
+
+    def _prefix_walks(self, text, cache_size=4096):
+        """
+        Yields ``(start, matches)`` for every offset of ``text``, where
+        ``matches`` lists the ``(end, b_key, index)`` of the keys starting
+        there, shortest first. ``text`` is a string, ``bytes`` or an
+        iterable of either; offsets count characters for strings and bytes
+        for ``bytes``.
+
+        The text is encoded once and walked byte by byte from each offset;
+        only the bytes a walk may still need are kept between chunks. Walks
+        from neighbouring offsets mostly repeat the same few transitions
+        near the root, so up to ``cache_size`` transitions are cached.
+        """
+        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
+        if isinstance(text, (str, bytes, bytearray)):
+            text = [text]
+        chunks = iter(text)
+        follow_char = self.dct.follow_char
+        has_value = self._has_value
+        separator = self._payload_separator
+        transitions = {}
+        data = b""
+        binary = False
+        pos = 0  # byte offset of the next start in ``data``
+        start = 0  # its offset in the text
+        eof = False
+
+        while True:
+            size = len(data)
+            while pos < size:
+                matches = []
+                index = self.dct.ROOT
+                end = pos
+                chars = 0
+                while end < size:
+                    label = data[end]
+                    if label in separator:
+                        break
+                    transition = (index << 8) | label
+                    if transition in transitions:
+                        index, is_key = transitions[transition]
+                    else:
+                        index = follow_char(label, index)
+                        is_key = index is not None and bool(has_value(index))
+                        if len(transitions) < cache_size:
+                            transitions[transition] = (index, is_key)
+                    if index is None:
+                        break
+                    end += 1
+                    if end == size or data[end] & 0xC0 != 0x80:
+                        chars += 1
+                        if is_key:
+                            stop = start + (end - pos if binary else chars)
+                            matches.append((stop, data[pos:end], index))
+                else:
+                    if not eof:
+                        break  # A longer key may continue in the next chunk.
+
+                yield start, matches
+                pos += 1 if binary else _utf8_length(data[pos])
+                start += 1
+
+            if eof:
+                return
+            chunk = next(chunks, None)
+            if chunk is None:
+                eof = True
+            elif isinstance(chunk, str):
+                data = data[pos:] + chunk.encode("utf8")
+                pos = 0
+            else:
+                binary = True
+                data = data[pos:] + bytes(chunk)
+                pos = 0
+
+    def _token(self, start, match):
+        end, b_key, index = match
+        if self._has_values:
+            return start, end, b_key.decode("utf8"), self._token_value(index)
+        return start, end, b_key.decode("utf8")
+
+    def _tokenize_all(self, text):
+        for start, matches in self._prefix_walks(text):
+            for match in matches:
+                yield self._token(start, match)
+
+    def _tokenize_longest(self, text):
+        next_start = 0
+        for start, matches in self._prefix_walks(text):
+            if start >= next_start and matches:
+                token = self._token(start, matches[-1])
+                next_start = token[1]
+                yield token
+
+    def _tokenize_min_tokens(self, text):
+        # Shortest path over character offsets: a key is an edge from its
+        # start to its end, an unmatched character an edge to the next
+        # offset, each costing 1. ``best[offset]`` is (cost, previous
+        # offset, match or None). Once no edge spans an offset, every
+        # segmentation goes through it, so the path up to it is final.
+        best = {0: (0, None, None)}
+        cut = 0
+        furthest = 0
+        for start, matches in self._prefix_walks(text):
+            if start == furthest and start > cut:
+                for token in self._min_tokens_path(best, cut, start):
+                    yield token
+                best = {start: best[start]}
+                cut = start
+
+            cost = best[start][0] + 1
+            for end, target in [(start + 1, None)] + [(match[0], match) for match in matches]:
+                if end not in best or cost < best[end][0]:
+                    best[end] = (cost, start, target)
+                furthest = max(furthest, end)
+
+        for token in self._min_tokens_path(best, cut, furthest):
+            yield token
+
+    def _min_tokens_path(self, best, cut, offset):
+        res = []
+        while offset != cut:
+            _, start, match = best[offset]
+            if match is not None:
+                res.append(self._token(start, match))
+            offset = start
+        res.reverse()
         return res
 
 
+def _encode_keys(keys):
+    return [key if isinstance(key, bytes) else key.encode("utf8") for key in keys]
+
+
+def _take(items, limit):
+    "Yields the first ``limit`` of ``items``, or all of them if ``limit`` is None."
+    if limit is None:
+        yield from items
+        return
+    if limit <= 0:
+        return
+    for item in items:
+        yield item
+        limit -= 1
+        if not limit:
+            return
+
+
+def _shuffle(rng, items):
+    "Shuffles ``items`` in place (Fisher-Yates) using only ``rng.randrange``."
+    for i in range(len(items) - 1, 0, -1):
+        j = rng.randrange(i + 1)
+        items[i], items[j] = items[j], items[i]
+
+
+def _sample_ranks(rng, total, n):
+    """
+    Returns ``n`` distinct random integers of ``range(total)`` in random
+    order, using only ``rng.randrange`` (Floyd's algorithm).
+    """
+    chosen = set()
+    ranks = []
+    for j in range(total - n, total):
+        rank = rng.randrange(j + 1)
+        if rank in chosen:
+            rank = j
+        chosen.add(rank)
+        ranks.append(rank)
+    _shuffle(rng, ranks)
+    return ranks
+
+
+def _struct_tokens(fmt):
+    """
+    Splits a struct format into its byte order character and one token
+    per field (``"H"``, ``"10s"``) or run of padding (``"3x"``).
+    """
+    fmt = fmt.replace(" ", "")
+    order = "@"
+    if fmt and fmt[0] in "@=<>!":
+        order, fmt = fmt[0], fmt[1:]
+    tokens = []
+    count = ""
+    for char in fmt:
+        if char.isdigit():
+            count += char
+        elif char in "spx":
+            tokens.append(count + char)
+            count = ""
+        else:
+            tokens.extend([char] * int(count or 1))
+            count = ""
+    return order, tokens
+
+
+# Struct codes whose values fit an array.array of the same typecode.
+_ARRAY_TYPECODES = "bBhHiIlLqQfd"
+
+
+def _utf8_length(lead):
+    "Returns the length of the UTF-8 sequence starting with byte ``lead``."
+    if lead < 0xC0:
+        return 1
+    if lead < 0xE0:
+        return 2
+    if lead < 0xF0:
+        return 3
+    return 4
+
+
 class CompletionDAWG(DAWG):
     """
     DAWG with key completion support.
     """
 
+    counts = None
+    _count_values = False
+
     def __init__(self):
         super(CompletionDAWG, self).__init__()
         self.guide = None
@@ -151,40 +572,491 @@ class CompletionDAWG(DAWG):
 
         return res
 
-    def iterkeys(self, prefix=""):
+    def iterkeys(self, prefix="", start_after=None, cursor=None):
+        """
+        Yields the keys starting with ``prefix``. Iteration resumes right
+        after the key ``start_after`` or the token ``cursor`` (see
+        ``cursor()``), in time proportional to the length of that key.
+        """
         b_prefix = prefix.encode("utf8")
         index = self.dct.follow_bytes(b_prefix, self.dct.ROOT)
         if index is None:
             return
 
         completer = wrapper.Completer(self.dct, self.guide)
-        completer.start(index, b_prefix)
+        self._start(completer, index, b_prefix, start_after, cursor)
 
         while completer.next():
             yield completer.key.decode("utf8")
 
-    def load(self, path):
+    def count(self, prefix=""):
+        """
+        Returns the number of keys starting with ``prefix`` (the length of
+        ``keys(prefix)``). With a counts index (see ``build_counts()``) this
+        only follows ``prefix``; otherwise the keys are enumerated.
+        """
+        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
+        b_prefix = _encode_keys([prefix])[0]
+        index = self.dct.follow_bytes(b_prefix, self.dct.ROOT)
+        if index is None:
+            return 0
+        if self.counts is not None:
+            return self.counts.count(index)
+
+        res = 0
+        completer = wrapper.Completer(self.dct, self.guide)
+        completer.start(index, b_prefix)
+        while completer.next():
+            res += 1
+        return res
+
+    def build_counts(self):
+        """
+        Builds the counts index (the number of keys below every node) in
+        one pass over the DAWG, attaches it and returns it. Save it with
+        ``save(path)`` and attach it later with ``load_counts(path)``.
+        """
+        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
+        self.counts = wrapper.Counts.build(self.dct, self.guide, self._count_values)
+        return self.counts
+
+    def load_counts(
+        self,
+        path,
+        backend="file",
+        cache_blocks=0,
+        block_size=wrapper.DEFAULT_BLOCK_SIZE,
+    ):
+        """
+        Attaches a counts index saved from ``build_counts()``. See
+        ``load`` for the supported arguments.
+        """
+        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
+        counts = wrapper.Counts.load(path, backend, cache_blocks, block_size)
+        if not counts.matches(self.dct):
+            counts.close()
+            raise ValueError(f"{path!r} was not built for this DAWG")
+        self.counts = counts
+        return self
+
+    def index(self, key):
+        """
+        Returns the lexicographic rank of ``key`` among the keys (the
+        position of ``key`` in ``keys()``), raising KeyError if it is
+        missing. Together with ``key_at()`` this makes the DAWG a minimal
+        perfect hash. Needs a counts index (see ``build_counts()``).
+        """
+        b_key = _encode_keys([key])[0]
+        rank = self._rank(b_key)
+        if rank is None:
+            raise KeyError(key)
+        return rank
+
+    def key_at(self, rank):
+        """
+        Returns the key at position ``rank`` of ``keys()``, raising
+        IndexError if it is out of range. Needs a counts index (see
+        ``build_counts()``).
+        """
+        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
+        assert self.counts is not None, "build_counts() or load_counts() must be called first"
+        if not 0 <= rank < self.counts.count(self.dct.ROOT):
+            raise IndexError("key rank out of range")
+        return self._key_part(self._raw_key_at(rank)).decode("utf8")
+
+    def sample(self, n, prefix="", rng=None):
+        """
+        Returns ``n`` distinct random keys starting with ``prefix``, every
+        selection being equally likely, like ``random.sample(keys(prefix),
+        n)``. ``rng`` is anything with a ``randrange()`` method, such as a
+        ``random.Random`` instance (the ``random`` module by default).
+
+        On ``BytesDAWG`` and ``RecordDAWG`` the population is the items, so
+        a key stored with several values can be returned more than once.
+
+        With a counts index (see ``build_counts()``) each sample walks down
+        from ``prefix`` picking children in proportion to their number of
+        keys; otherwise the keys are enumerated once, keeping ``n`` of them.
+        """
+        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
+        if rng is None:
+            import random as rng
+
+        b_prefix = _encode_keys([prefix])[0]
+        index = self.dct.follow_bytes(b_prefix, self.dct.ROOT)
+
+        if self.counts is not None:
+            total = 0 if index is None else self.counts.count(index)
+            if not 0 <= n <= total:
+                raise ValueError("Sample larger than population or is negative")
+            return [
+                self._key_part(self._raw_key_at(rank, index, b_prefix)).decode("utf8")
+                for rank in _sample_ranks(rng, total, n)
+            ]
+
+        res = []
+        total = 0
+        if index is not None and n > 0:
+            completer = wrapper.Completer(self.dct, self.guide)
+            completer.start(index, b_prefix)
+            while completer.next():
+                total += 1
+                if len(res) < n:
+                    res.append(bytes(completer.key))
+                else:
+                    pos = rng.randrange(total)
+                    if pos < n:
+                        res[pos] = bytes(completer.key)
+        if not 0 <= n <= total:
+            raise ValueError("Sample larger than population or is negative")
+        _shuffle(rng, res)
+        return [self._key_part(key).decode("utf8") for key in res]
+
+    def _rank(self, b_key, exact=True):
+        """
+        Returns the number of raw keys sorting before ``b_key``, or None if
+        ``b_key`` isn't a path in the DAWG (or, when ``exact``, isn't a key).
+        """
+        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
+        assert self.counts is not None, "build_counts() or load_counts() must be called first"
+        rank = 0
+        index = self.dct.ROOT
+        for label in b_key:
+            if self.dct.has_value(index):
+                rank += 1  # The key ending here sorts before its extensions.
+            child_label = self.guide.child(index)
+            while child_label and child_label < label:
+                child = self.dct.follow_char(child_label, index)
+                rank += self.counts.count(child)
+                child_label = self.guide.sibling(child)
+            if child_label != label:
+                return None
+            index = self.dct.follow_char(label, index)
+        if exact and not self.dct.has_value(index):
+            return None
+        return rank
+
+    def _raw_key_at(self, rank, index=wrapper.Dictionary.ROOT, prefix=b""):
+        "Returns the raw key at position ``rank`` below ``index``."
+        key = bytearray(prefix)
+        while True:
+            if self.dct.has_value(index):
+                if not rank:
+                    return bytes(key)
+                rank -= 1
+            label = self.guide.child(index)
+            while label:
+                child = self.dct.follow_char(label, index)
+                count = self.counts.count(child)
+                if rank < count:
+                    break
+                rank -= count
+                label = self.guide.sibling(child)
+            key.append(label)
+            index = child
+
+    def fuzzy_keys(self, word, max_distance=1):
+        """
+        Returns the keys within Levenshtein distance ``max_distance`` of
+        ``word`` (the number of characters to insert, delete or
+        substitute), in lexicographic order.
+        """
+        return [key for key, index in self._fuzzy(word, max_distance)]
+
+    def _fuzzy(self, word, max_distance):
+        """
+        Returns a (key, index) pair for each key within ``max_distance``
+        of ``word``. The DAWG is walked depth-first with one row of the
+        edit distance table per character, which simulates a Levenshtein
+        automaton; a branch is dropped once its whole row exceeds
+        ``max_distance``.
+        """
+        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
+        if isinstance(word, bytes):
+            word = word.decode("utf8")
+        res = []
+        # Each entry is (index, key, pending, row); ``pending`` holds the
+        # leading bytes of an incomplete UTF-8 character. Children are
+        # pushed in reverse so that keys come out in lexicographic order.
+        stack = [(self.dct.ROOT, b"", b"", list(range(len(word) + 1)))] if self.guide.size() else []
+        while stack:
+            index, key, pending, row = stack.pop()
+            if not pending and row[-1] <= max_distance and self._has_value(index):
+                res.append((key.decode("utf8"), index))
+
+            children = []
+            label = self.guide.child(index)
+            while label:
+                child = self.dct.follow_char(label, index)
+                if label not in self._payload_separator:
+                    char = pending + bytes([label])
+                    if len(char) < _utf8_length(char[0]):
+                        children.append((child, key + bytes([label]), char, row))
+                    else:
+                        next_row = self._fuzzy_row(row, word, char.decode("utf8"))
+                        if min(next_row) <= max_distance:
+                            children.append((child, key + bytes([label]), b"", next_row))
+                label = self.guide.sibling(child)
+            children.reverse()
+            stack.extend(children)
+        return res
+
+    def _fuzzy_row(self, row, word, char):
+        "Returns the edit distance row following ``row`` after ``char``."
+        next_row = [row[0] + 1]
+        for pos, word_char in enumerate(word):
+            next_row.append(
+                min(
+                    next_row[pos] + 1,
+                    row[pos + 1] + 1,
+                    row[pos] + (word_char != char),
+                )
+            )
+        return next_row
+
+    def match(self, pattern, min_length=None, max_length=None):
+        """
+        Returns the keys matching the shell-style ``pattern`` (``?`` for
+        one character, ``*`` for any number of them, ``[...]`` for a
+        character class) and having between ``min_length`` and
+        ``max_length`` characters, in lexicographic order. Branches the
+        pattern rules out are never walked.
+        """
+        automaton = patterns.Wildcard(pattern)
+        return [key for key, index in self._match(automaton, min_length, max_length)]
+
+    def regex_keys(self, pattern):
+        """
+        Returns the keys fully matching the regular expression
+        ``pattern``, in lexicographic order. See ``patterns.Regex`` for
+        the supported syntax.
+        """
+        return [key for key, index in self._match(patterns.Regex(pattern))]
+
+    def _match(self, automaton, min_length=None, max_length=None):
+        """
+        Returns a (key, index) pair for each key accepted by ``automaton``.
+
+        The walk explores pairs of DAWG nodes and automaton states.
+        Suffixes are shared between keys, so a pair that led to no match
+        is remembered and not explored again.
+        """
+        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
+        res = []
+        state = automaton.start()
+        if state is None or not self.guide.size():
+            return res
+        min_length = min_length or 0
+        bounded = min_length or max_length is not None
+        dead = set()
+
+        # Each entry is (index, key, pending, length, state): ``pending``
+        # holds the leading bytes of an incomplete UTF-8 character and
+        # ``length`` counts the complete characters of ``key``. A (pair,
+        # found) entry marks the end of a pair's subtree, where the pair is
+        # remembered as dead if nothing was found below it.
+        stack = [(self.dct.ROOT, b"", b"", 0, state)]
+        while stack:
+            entry = stack.pop()
+            if len(entry) == 2:
+                pair, found = entry
+                if len(res) == found:
+                    dead.add(pair)
+                continue
+            index, key, pending, length, state = entry
+            pair = (index, pending, state, length) if bounded else (index, pending, state)
+            if pair in dead:
+                continue
+            stack.append((pair, len(res)))
+
+            children = []
+            if not pending:
+                if automaton.accepts(state) and length >= min_length and self._has_value(index):
+                    res.append((key.decode("utf8"), index))
+                if max_length is not None and length >= max_length:
+                    continue
+
+                chars = automaton.literals(state)
+                if chars is not None:
+                    # Only these characters can follow: look them up directly.
+                    for char in chars:
+                        b_char = char.encode("utf8")
+                        child = self.dct.follow_bytes(b_char, index)
+                        if child is not None and b_char[0] not in self._payload_separator:
+                            next_state = automaton.step(state, char)
+                            children.append((child, key + b_char, b"", length + 1, next_state))
+                    children.reverse()
+                    stack.extend(children)
+                    continue
+
+            label = self.guide.child(index)
+            while label:
+                child = self.dct.follow_char(label, index)
+                if label not in self._payload_separator:
+                    b_label = bytes((label,))
+                    char = pending + b_label
+                    if len(char) < _utf8_length(char[0]):
+                        children.append((child, key + b_label, char, length, state))
+                    else:
+                        next_state = automaton.step(state, char.decode("utf8"))
+                        if next_state is not None:
+                            children.append((child, key + b_label, b"", length + 1, next_state))
+                label = self.guide.sibling(child)
+            children.reverse()
+            stack.extend(children)
+        return res
+
+    def keys_range(self, lo=None, hi=None, reverse=False):
+        """
+        Returns the keys ``k`` with ``lo <= k < hi`` (``None`` leaves a
+        bound open) in ascending order, or descending with ``reverse``.
+        The traversal seeks straight to the first key in range and stops
+        at the other bound.
+        """
+        return [
+            self._key_part(completer.key).decode("utf8")
+            for completer in self._iter_range(lo, hi, reverse)
+        ]
+
+    def _key_part(self, raw_key):
+        "Returns the key part of a raw completer key."
+        return raw_key
+
+    def _iter_range(self, lo, hi, reverse):
+        """
+        Yields the completer positioned on each raw key in the range
+        ``lo <= key < hi``.
+        """
+        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
+        b_lo = None if lo is None else _encode_keys([lo])[0]
+        b_hi = None if hi is None else _encode_keys([hi])[0]
+
+        if reverse:
+            completer = wrapper.ReverseCompleter(self.dct, self.guide)
+            if b_hi is None:
+                completer.start(self.dct.ROOT)
+            else:
+                completer.start_before(self.dct.ROOT, b"", b_hi)
+        else:
+            completer = wrapper.Completer(self.dct, self.guide)
+            if b_lo is None:
+                completer.start(self.dct.ROOT)
+            else:
+                completer.start_at(self.dct.ROOT, b"", b_lo)
+
+        while completer.next():
+            b_key = self._key_part(completer.key)
+            if reverse:
+                if b_lo is not None and b_key < b_lo:
+                    return
+            elif b_hi is not None and b_key >= b_hi:
+                return
+            yield completer
+
+    def cursor(self, key):
+        """
+        Returns an opaque, URL-safe token which resumes iteration right
+        after ``key`` (a key or an item as yielded by the iter* methods)
+        when passed as ``cursor``.
+        """
+        return hexlify(self._raw_key(key)).decode("ascii")
+
+    def _raw_key(self, key):
+        "Returns the raw completer key of a key or item."
+        if isinstance(key, tuple):
+            key = key[0]
+        if not isinstance(key, bytes):
+            key = key.encode("utf8")
+        return key
+
+    def _start(self, completer, index, b_prefix, start_after=None, cursor=None):
+        if cursor is not None:
+            completer.start_after(index, b_prefix, unhexlify(cursor))
+        elif start_after is not None:
+            completer.start_after(index, b_prefix, self._raw_key(start_after))
+        else:
+            completer.start(index, b_prefix)
+
+    def load(
+        self,
+        path,
+        backend="file",
+        cache_blocks=0,
+        block_size=wrapper.DEFAULT_BLOCK_SIZE,
+    ):
         """
         Loads DAWG from a file.
+
+        See ``DAWG.load`` for the supported arguments. The dictionary and
+        the guide each get their own page cache.
+        """
+        fp = open(path, "rb")
+        return self.read(fp, backend, cache_blocks, block_size)
+
+    def read(
+        self,
+        fp,
+        backend="file",
+        cache_blocks=0,
+        block_size=wrapper.DEFAULT_BLOCK_SIZE,
+    ):
+        """
+        Loads DAWG from an open, seekable binary file object.
+
+        See ``DAWG.read`` for details.
         """
         self.dct = wrapper.Dictionary()
         self.guide = wrapper.Guide()
 
-        fp = open(path, "rb")
-        self.dct.read(fp, path)
+        path = getattr(fp, "name", None)
+        self.dct.read(fp, path, backend, cache_blocks, block_size)
         assert isinstance(self.dct.fp, wrapper.FilePointer), "FilePointer was not loaded correctly"
         # skip dict base_size (4 bytes) and dictionary
-        self.guide.read(fp, path, 4 + self.dct.fp.base_size * 4)
+        guide_skip = 4 + self.dct.fp.base_size * 4
+        if backend == "mmap":
+            # The guide reads a view of the dictionary's mapping instead of
+            # mapping the file a second time.
+            self.guide = wrapper.Guide.frombytes(self.dct.fp.buf, guide_skip)
+            self.guide.file_path = path
+        else:
+            self.guide.read(fp, path, guide_skip, backend, cache_blocks, block_size)
+            if backend == "array":
+                fp.close()  # Everything was copied into RAM.
 
         return self
 
+    def frombytes(self, data):
+        """
+        Loads DAWG from an in-memory buffer without copying it.
+
+        See ``DAWG.frombytes`` for details.
+        """
+        self.dct = wrapper.Dictionary.frombytes(data)
+        # skip dict base_size (4 bytes) and dictionary
+        self.guide = wrapper.Guide.frombytes(data, 4 + self.dct.fp.base_size * 4)
+        return self
+
+    def tobytes(self):
+        """
+        Returns the DAWG in its binary file format.
+
+        See ``DAWG.tobytes`` for details.
+        """
+        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
+        return self.dct.tobytes() + self.guide.tobytes()
+
     def close(self):
-        if self.dct is not None:
-            self.dct.close()
-            self.dct = None
+        # The guide may hold a view of the dictionary's memory map, so it
+        # is released first.
         if self.guide is not None:
             self.guide.close()
             self.guide = None
+        if self.dct is not None:
+            self.dct.close()
+            self.dct = None
+        if self.counts is not None:
+            self.counts.close()
+            self.counts = None
 
     def __enter__(self):
         return self
@@ -206,6 +1078,8 @@ class BytesDAWG(CompletionDAWG):
     {unicode -> list of bytes objects} mapping.
     """
 
+    _has_values = True
+
     def __init__(self, payload_separator=PAYLOAD_SEPARATOR):
         self._payload_separator = payload_separator
 
@@ -230,6 +1104,26 @@ class BytesDAWG(CompletionDAWG):
 
         return self.b_get_value(key) or default
 
+    def get_first(self, key, default=None):
+        """
+        Returns the first payload for a given key or ``default`` if the
+        key is not found. Other payloads of the key are not read.
+        """
+        for value in self.iter_values(key):
+            return value
+        return default
+
+    def iter_values(self, key):
+        """
+        Yields the payloads for a given key one by one, decoding each only
+        when it is reached. Yields nothing if the key is not found.
+        """
+        if not isinstance(key, bytes):
+            key = key.encode("utf8")
+        index = self._follow_key(key)
+        if index:
+            yield from self._iter_values(index)
+
     def _follow_key(self, b_key):
         index = self.dct.follow_bytes(b_key, self.dct.ROOT)
         if not index:
@@ -242,18 +1136,28 @@ class BytesDAWG(CompletionDAWG):
         return index
 
     def _value_for_index(self, index):
-        res = []
+        return list(self._iter_values(index))
 
+    def _iter_values(self, index):
         completer = wrapper.Completer(self.dct, self.guide)
-
         completer.start(index)
         while completer.next():
-            # a2b_base64 doesn't support bytearray in python 2.6
-            # so it is converted (and copied) to bytes
-            b64_data = bytes(completer.key)
-            res.append(a2b_base64(b64_data))
+            # The completer key holds only the base64 payload here, so it
+            # is decoded in place instead of being copied to bytes first.
+            yield self._decode_value(completer.key)
 
-        return res
+    def _decode_value(self, b64_data):
+        return a2b_base64(b64_data)
+
+    def _split_item(self, raw_key):
+        """
+        Decodes a raw ``key + separator + payload`` completion into a
+        (key, value) tuple, reading the payload through a memoryview
+        instead of copying it out of ``raw_key``.
+        """
+        pos = raw_key.index(self._payload_separator)
+        payload = memoryview(raw_key)[pos + len(self._payload_separator) :]
+        return raw_key[:pos].decode("utf8"), self._decode_value(payload)
 
     def b_get_value(self, b_key):
         index = self._follow_key(b_key)
@@ -261,6 +1165,33 @@ class BytesDAWG(CompletionDAWG):
             return []
         return self._value_for_index(index)
 
+    def contains_many(self, keys):
+        """
+        Returns a list of booleans telling whether each of ``keys`` is in
+        this DAWG, in the order of ``keys``.
+        """
+        return [
+            bool(index)
+            for index in self._follow_many(_encode_keys(keys), self._payload_separator)
+        ]
+
+    def get_many(self, keys, default=None):
+        """
+        Returns a list with the payloads of each of ``keys`` (or ``default``
+        for missing keys), in the order of ``keys``.
+        """
+        return [value or default for value in self.b_get_many(_encode_keys(keys))]
+
+    def b_get_many(self, b_keys):
+        """
+        Returns a list with the payloads of each of ``b_keys`` (an empty
+        list for missing keys), in the order of ``b_keys``.
+        """
+        return [
+            self._value_for_index(index) if index else []
+            for index in self._follow_many(b_keys, self._payload_separator)
+        ]
+
     def keys(self, prefix=""):
         if not isinstance(prefix, bytes):
             prefix = prefix.encode("utf8")
@@ -282,7 +1213,12 @@ class BytesDAWG(CompletionDAWG):
             res.append(u_key)
         return res
 
-    def iterkeys(self, prefix=""):
+    def iterkeys(self, prefix="", start_after=None, cursor=None):
+        """
+        Yields the key of every item starting with ``prefix``. Resuming
+        after a key skips all of its payloads; use ``cursor()`` on an item
+        to resume between payloads of the same key.
+        """
         if not isinstance(prefix, bytes):
             prefix = prefix.encode("utf8")
 
@@ -294,7 +1230,7 @@ class BytesDAWG(CompletionDAWG):
                 return
 
         completer = wrapper.Completer(self.dct, self.guide)
-        completer.start(index, prefix)
+        self._start(completer, index, prefix, start_after, cursor)
 
         while completer.next():
             payload_idx = completer.key.index(self._payload_separator)
@@ -316,17 +1252,15 @@ class BytesDAWG(CompletionDAWG):
         completer.start(index, prefix)
 
         while completer.next():
-            key, value = completer.key.split(self._payload_separator)
-            res.append(
-                (
-                    key.decode("utf8"),
-                    a2b_base64(bytes(value)),
-                )  # bytes() cast is a python 2.6 fix
-            )
+            res.append(self._split_item(completer.key))
 
         return res
 
-    def iteritems(self, prefix=""):
+    def iteritems(self, prefix="", start_after=None, cursor=None):
+        """
+        Yields the (key, value) items starting with ``prefix``, resuming
+        after the key or item ``start_after`` or the token ``cursor``.
+        """
         if not isinstance(prefix, bytes):
             prefix = prefix.encode("utf8")
 
@@ -337,53 +1271,107 @@ class BytesDAWG(CompletionDAWG):
                 return
 
         completer = wrapper.Completer(self.dct, self.guide)
-        completer.start(index, prefix)
+        self._start(completer, index, prefix, start_after, cursor)
 
         while completer.next():
-            key, value = completer.key.split(self._payload_separator)
-            item = (
-                key.decode("utf8"),
-                a2b_base64(bytes(value)),
-            )  # bytes() cast is a python 2.6 fix
-            yield item
+            yield self._split_item(completer.key)
 
-    def _has_value(self, index):
-        return self.dct.follow_bytes(PAYLOAD_SEPARATOR, index)
-
-    def _similar_items(self, current_prefix, key, index, replace_chars):
+    def items_range(self, lo=None, hi=None, reverse=False):
+        """
+        Returns the (key, value) items with ``lo <= key < hi`` (``None``
+        leaves a bound open) in ascending order, or descending with
+        ``reverse``.
+        """
         res = []
-        start_pos = len(current_prefix)
-        end_pos = len(key)
-        word_pos = start_pos
+        for completer in self._iter_range(lo, hi, reverse):
+            res.append(self._split_item(completer.key))
+        return res
 
-        while word_pos < end_pos:
-            b_step = key[word_pos].encode("utf8")
+    def _key_part(self, raw_key):
+        return raw_key[: raw_key.index(self._payload_separator)]
 
-            if b_step in replace_chars:
-                next_index = index
-                b_replace_char, u_replace_char = replace_chars[b_step]
+    def index(self, key):
+        """
+        Returns the position of the first item of ``key`` in ``items()``,
+        raising KeyError if it is missing. Needs a counts index (see
+        ``build_counts()``).
+        """
+        b_key = _encode_keys([key])[0]
+        rank = self._rank(b_key + self._payload_separator, exact=False)
+        if rank is None:
+            raise KeyError(key)
+        return rank
 
-                next_index = self.dct.follow_bytes(b_replace_char, next_index)
-                if next_index:
-                    prefix = current_prefix + key[start_pos:word_pos] + u_replace_char
-                    extra_items = self._similar_items(
-                        prefix, key, next_index, replace_chars
-                    )
-                    res += extra_items
+    def fuzzy_items(self, word, max_distance=1):
+        """
+        Returns a list of (key, values) tuples for the keys within
+        Levenshtein distance ``max_distance`` of ``word``, in
+        lexicographic order. See ``fuzzy_keys``.
+        """
+        return [
+            (key, self._value_for_index(self.dct.follow_bytes(self._payload_separator, index)))
+            for key, index in self._fuzzy(word, max_distance)
+        ]
 
-            index = self.dct.follow_bytes(b_step, index)
-            if not index:
-                break
-            word_pos += 1
+    def regex_items(self, pattern):
+        """
+        Returns a list of (key, values) tuples for the keys fully matching
+        the regular expression ``pattern``, in lexicographic order. See
+        ``regex_keys``.
+        """
+        return [
+            (key, self._value_for_index(self._has_value(index)))
+            for key, index in self._match(patterns.Regex(pattern))
+        ]
 
+    def prefix_items(self, key):
+        """
+        Returns a list of (prefix, values) tuples for the keys of this DAWG
+        that are prefixes of ``key``, shortest first, collected in a single
+        walk along ``key``.
+        """
+        return self._prefix_items(key)
+
+    def longest_prefix_item(self, key, default=None):
+        """
+        Returns the (prefix, values) tuple of the longest key of this DAWG
+        that is a prefix of ``key``, or ``default`` if there is none. Only
+        the payloads of that key are read.
+        """
+        return self._longest_prefix_item(key, default)
+
+    def _has_value(self, index):
+        return self.dct.follow_bytes(self._payload_separator, index)
+
+    def _value_index(self, index):
+        return self._has_value(index)
+
+    def _token_value(self, index):
+        return self._value_for_index(self._has_value(index))
+
+    def _raw_key(self, key):
+        if isinstance(key, tuple):
+            key, value = key
+            payload = b2a_base64(self._encode_value(value))
         else:
-            index = self.dct.follow_bytes(self._payload_separator, index)
-            if index:
-                found_key = current_prefix + key[start_pos:]
-                value = self._value_for_index(index)
-                res.insert(0, (found_key, value))
+            # Sorts after every base64 payload of the key.
+            payload = b"\xff"
+        if not isinstance(key, bytes):
+            key = key.encode("utf8")
+        return key + self._payload_separator + payload
 
-        return res
+    def _encode_value(self, value):
+        return value
+
+    def iter_similar_items(self, key, replaces, limit=None):
+        """
+        Yields (key, value) tuples for the variants of ``key`` in this
+        DAWG according to ``replaces``, stopping after ``limit`` of them.
+        See ``DAWG.iter_similar_keys``.
+        """
+        variants = self._iter_similar(key, replaces)
+        for found_key, index in _take(variants, limit):
+            yield found_key, self._value_for_index(self._has_value(index))
 
     def similar_items(self, key, replaces):
         """
@@ -391,43 +1379,17 @@ class BytesDAWG(CompletionDAWG):
         in this DAWG according to ``replaces``.
 
         ``replaces`` is an object obtained from
-        ``DAWG.compile_replaces(mapping)`` where mapping is a dict
-        that maps single-char unicode sitrings to another single-char
-        unicode strings.
+        ``DAWG.compile_replaces(mapping)``.
         """
-        return self._similar_items("", key, self.dct.ROOT, replaces)
-
-    def _similar_item_values(self, start_pos, key, index, replace_chars):
-        res = []
-        end_pos = len(key)
-        word_pos = start_pos
-
-        while word_pos < end_pos:
-            b_step = key[word_pos].encode("utf8")
-
-            if b_step in replace_chars:
-                next_index = index
-                b_replace_char, u_replace_char = replace_chars[b_step]
+        return list(self.iter_similar_items(key, replaces))
 
-                next_index = self.dct.follow_bytes(b_replace_char, next_index)
-                if next_index:
-                    extra_items = self._similar_item_values(
-                        word_pos + 1, key, next_index, replace_chars
-                    )
-                    res += extra_items
-
-            index = self.dct.follow_bytes(b_step, index)
-            if not index:
-                break
-            word_pos += 1
-
-        else:
-            index = self.dct.follow_bytes(self._payload_separator, index)
-            if index:
-                value = self._value_for_index(index)
-                res.insert(0, value)
-
-        return res
+    def iter_similar_item_values(self, key, replaces, limit=None):
+        """
+        Yields the values for the variants of ``key`` in this DAWG
+        according to ``replaces``, stopping after ``limit`` of them.
+        """
+        for _, value in self.iter_similar_items(key, replaces, limit):
+            yield value
 
     def similar_item_values(self, key, replaces):
         """
@@ -435,11 +1397,9 @@ class BytesDAWG(CompletionDAWG):
         in this DAWG according to ``replaces``.
 
         ``replaces`` is an object obtained from
-        ``DAWG.compile_replaces(mapping)`` where mapping is a dict
-        that maps single-char unicode sitrings to another single-char
-        unicode strings.
+        ``DAWG.compile_replaces(mapping)``.
         """
-        return self._similar_item_values(0, key, self.dct.ROOT, replaces)
+        return list(self.iter_similar_item_values(key, replaces))
 
 
 class RecordDAWG(BytesDAWG):
@@ -447,18 +1407,97 @@ class RecordDAWG(BytesDAWG):
         super(RecordDAWG, self).__init__(payload_separator)
         self._struct = struct.Struct(str(fmt))
         self.fmt = fmt
+        self._field_codes = [
+            token[-1] for token in _struct_tokens(str(fmt))[1] if token[-1] != "x"
+        ]
 
-    def _value_for_index(self, index):
-        value = super(RecordDAWG, self)._value_for_index(index)
-        return [self._struct.unpack(val) for val in value]
+    def _decode_value(self, b64_data):
+        return self._struct.unpack(a2b_base64(b64_data))
 
-    def items(self, prefix=""):
-        res = super(RecordDAWG, self).items(prefix)
-        return [(key, self._struct.unpack(val)) for (key, val) in res]
+    def items_columnar(self, prefix=""):
+        """
+        Returns ``(keys, columns)`` for the items starting with ``prefix``:
+        the key of every record, in ``items()`` order, and one column per
+        field of ``fmt``. Numeric columns are ``array.array`` objects, so
+        each value takes its packed size instead of a Python object.
+        """
+        keys, packed = self._packed_items(prefix)
+        return keys, self._columns(packed)
+
+    def get_many_columnar(self, keys):
+        """
+        Returns ``(offsets, columns)`` for the records of each of ``keys``:
+        the records of ``keys[i]`` are rows ``offsets[i]:offsets[i + 1]``
+        of the columns, which are laid out as in ``items_columnar()``.
+        """
+        offsets, packed = self._packed_many(keys)
+        return offsets, self._columns(packed)
+
+    def _packed_items(self, prefix):
+        """
+        Returns the keys of the items starting with ``prefix`` and their
+        records packed back to back into one bytearray.
+        """
+        b_prefix = _encode_keys([prefix])[0]
+        keys = []
+        packed = bytearray()
+
+        index = self.dct.ROOT
+        if b_prefix:
+            index = self.dct.follow_bytes(b_prefix, index)
+            if not index:
+                return keys, packed
+
+        separator = self._payload_separator
+        completer = wrapper.Completer(self.dct, self.guide)
+        completer.start(index, b_prefix)
+        while completer.next():
+            raw_key = completer.key
+            pos = raw_key.index(separator)
+            keys.append(raw_key[:pos].decode("utf8"))
+            packed.extend(a2b_base64(memoryview(raw_key)[pos + len(separator) :]))
+        return keys, packed
+
+    def _packed_many(self, keys):
+        """
+        Returns the record offsets of each of ``keys`` and their records
+        packed back to back into one bytearray.
+        """
+        from array import array
+
+        offsets = array("L", [0])
+        packed = bytearray()
+        completer = wrapper.Completer(self.dct, self.guide)
+        for index in self._follow_many(_encode_keys(keys), self._payload_separator):
+            if index:
+                completer.start(index)
+                while completer.next():
+                    packed.extend(a2b_base64(completer.key))
+            offsets.append(len(packed) // self._struct.size)
+        return offsets, packed
+
+    def _columns(self, packed):
+        "Unpacks records packed back to back into one column per field."
+        from array import array
 
-    def iteritems(self, prefix=""):
-        res = super(RecordDAWG, self).iteritems(prefix)
-        return ((key, self._struct.unpack(val)) for (key, val) in res)
+        columns = [array(code) if code in _ARRAY_TYPECODES else [] for code in self._field_codes]
+        appends = [column.append for column in columns]
+
+        if hasattr(self._struct, "iter_unpack"):
+            records = self._struct.iter_unpack(packed)
+        else:
+            # MicroPython's struct has no iter_unpack().
+            size = self._struct.size
+            records = (
+                self._struct.unpack_from(packed, offset) for offset in range(0, len(packed), size)
+            )
+        for record in records:
+            for append, value in zip(appends, record):
+                append(value)
+        return columns
+
+    def _encode_value(self, value):
+        return self._struct.pack(*value)
 
 
 LOOKUP_ERROR = -1
@@ -470,6 +1509,8 @@ class IntDAWG(DAWG):
     It can store integer values for unicode keys.
     """
 
+    _has_values = True
+
     def __getitem__(self, key):
         res = self.get(key, LOOKUP_ERROR)
         if res == LOOKUP_ERROR:
@@ -491,6 +1532,49 @@ class IntDAWG(DAWG):
         assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
         return self.dct.find(key)
 
+    def prefix_items(self, key):
+        """
+        Returns a list of (prefix, value) tuples for the keys of this DAWG
+        that are prefixes of ``key``, shortest first, collected in a single
+        walk along ``key``.
+        """
+        return self._prefix_items(key)
+
+    def longest_prefix_item(self, key, default=None):
+        """
+        Returns the (prefix, value) tuple of the longest key of this DAWG
+        that is a prefix of ``key``, or ``default`` if there is none.
+        """
+        return self._longest_prefix_item(key, default)
+
+    def _value_for_index(self, index):
+        return self.dct.value(index)
+
+    def _token_value(self, index):
+        return self.dct.value(index)
+
+    def get_many(self, keys, default=None):
+        """
+        Returns a list with the value of each of ``keys`` (or ``default``
+        for missing keys), in the order of ``keys``.
+        """
+        return [
+            default if value == LOOKUP_ERROR else value
+            for value in self.b_get_many(_encode_keys(keys))
+        ]
+
+    def b_get_many(self, b_keys):
+        """
+        Returns a list with the value of each of ``b_keys`` (``LOOKUP_ERROR``
+        for missing keys), in the order of ``b_keys``.
+        """
+        return [
+            self.dct.value(index)
+            if index is not None and self.dct.has_value(index)
+            else LOOKUP_ERROR
+            for index in self._follow_many(b_keys)
+        ]
+
 
 class IntCompletionDAWG(CompletionDAWG, IntDAWG):
     """
@@ -498,6 +1582,8 @@ class IntCompletionDAWG(CompletionDAWG, IntDAWG):
     It can store integer values for unicode keys and support key completion.
     """
 
+    _count_values = True
+
     def items(self, prefix=""):
         if not isinstance(prefix, bytes):
             prefix = prefix.encode("utf8")
@@ -517,7 +1603,11 @@ class IntCompletionDAWG(CompletionDAWG, IntDAWG):
 
         return res
 
-    def iteritems(self, prefix=""):
+    def iteritems(self, prefix="", start_after=None, cursor=None):
+        """
+        Yields the (key, value) items starting with ``prefix``, resuming
+        after the key ``start_after`` or the token ``cursor``.
+        """
         if not isinstance(prefix, bytes):
             prefix = prefix.encode("utf8")
         index = self.dct.ROOT
@@ -528,7 +1618,66 @@ class IntCompletionDAWG(CompletionDAWG, IntDAWG):
                 return
 
         completer = wrapper.Completer(self.dct, self.guide)
-        completer.start(index, prefix)
+        self._start(completer, index, prefix, start_after, cursor)
 
         while completer.next():
             yield completer.key.decode("utf8"), completer.value()
+
+    def items_range(self, lo=None, hi=None, reverse=False):
+        """
+        Returns the (key, value) items with ``lo <= key < hi`` (``None``
+        leaves a bound open) in ascending order, or descending with
+        ``reverse``.
+        """
+        return [
+            (completer.key.decode("utf8"), completer.value())
+            for completer in self._iter_range(lo, hi, reverse)
+        ]
+
+    def aggregate(self, prefix=""):
+        """
+        Returns a dict with the ``count``, ``min``, ``max`` and ``sum`` of
+        the values of the keys starting with ``prefix`` (``min`` and
+        ``max`` are None when there are none). With a counts index built
+        by this class this only follows ``prefix``.
+        """
+        assert isinstance(self.dct, wrapper.Dictionary), "load() must be called before using DAWG"
+        b_prefix = _encode_keys([prefix])[0]
+        index = self.dct.follow_bytes(b_prefix, self.dct.ROOT)
+        if index is None:
+            count, low, high, total = 0, None, None, 0
+        elif self.counts is not None and self.counts.has_aggregates():
+            count, low, high, total = self.counts.aggregate(index)
+        else:
+            count, low, high, total = 0, None, None, 0
+            completer = wrapper.Completer(self.dct, self.guide)
+            completer.start(index, b_prefix)
+            while completer.next():
+                value = completer.value()
+                count += 1
+                total += value
+                if low is None or value < low:
+                    low = value
+                if high is None or value > high:
+                    high = value
+        return {"count": count, "min": low, "max": high, "sum": total}
+
+    def fuzzy_items(self, word, max_distance=1):
+        """
+        Returns a list of (key, value) tuples for the keys within
+        Levenshtein distance ``max_distance`` of ``word``, in
+        lexicographic order. See ``fuzzy_keys``.
+        """
+        return [
+            (key, self.dct.value(index)) for key, index in self._fuzzy(word, max_distance)
+        ]
+
+    def regex_items(self, pattern):
+        """
+        Returns a list of (key, value) tuples for the keys fully matching
+        the regular expression ``pattern``, in lexicographic order. See
+        ``regex_keys``.
+        """
+        return [
+            (key, self.dct.value(index)) for key, index in self._match(patterns.Regex(pattern))
+        ]
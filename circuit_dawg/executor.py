@@ -0,0 +1,125 @@
+"""
+Batch query executor running DAWG queries on a ``concurrent.futures`` pool.
+
+Queries are split into chunks, each worker thread or process lazily loads
+its own reader of the DAWG file, and results are streamed back in input
+order with a bounded number of chunks in flight.
+"""
+
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import count, islice
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_local = threading.local()
+_keys = count()
+_readers_lock = threading.Lock()
+_open_readers = {}  # executor key -> readers opened by its workers
+
+
+def _reader(spec):
+    "Returns the reader for ``spec`` owned by the current worker thread."
+    readers = _local.__dict__.setdefault("readers", {})
+    reader = readers.get(spec)
+    if reader is None:
+        key, dawg_class, dawg_args, path, backend = spec
+        reader = readers[spec] = dawg_class(*dawg_args).load(path, backend=backend)
+        with _readers_lock:
+            _open_readers.setdefault(key, []).append(reader)
+    return reader
+
+
+def _run_chunk(spec, method, chunk, args):
+    func = getattr(_reader(spec), method)
+    return [func(query, *args) for query in chunk]
+
+
+class QueryExecutor:
+    """
+    Runs queries against ``dawg_class(*dawg_args).load(path, backend)`` on
+    a pool of ``max_workers`` (default: one per core) threads
+    (``kind="thread"``) or processes (``kind="process"``).
+
+    At most ``max_pending`` chunks of ``chunk_size`` queries are submitted
+    ahead of the consumer, so memory stays bounded however long the input
+    iterable is.
+
+    ``close()`` closes the readers opened by worker threads; the files of
+    process workers are released when the processes exit.
+    """
+
+    def __init__(
+        self,
+        dawg_class,
+        path,
+        dawg_args=(),
+        backend="mmap",
+        kind="thread",
+        max_workers=None,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        max_pending=None,
+    ):
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if kind == "thread":
+            self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        elif kind == "process":
+            self._pool = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            raise ValueError(f"Unknown executor kind: {kind!r}")
+
+        self._spec = (next(_keys), dawg_class, tuple(dawg_args), path, backend)
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.max_pending = max_pending or 2 * max_workers
+
+    def map(self, method, queries, *args):
+        """
+        Yields ``getattr(dawg, method)(query, *args)`` for every query of
+        the ``queries`` iterable, in input order.
+        """
+        queries = iter(queries)
+        pending = deque()
+        while True:
+            while len(pending) < self.max_pending:
+                chunk = list(islice(queries, self.chunk_size))
+                if not chunk:
+                    break
+                pending.append(
+                    self._pool.submit(_run_chunk, self._spec, method, chunk, args)
+                )
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+    def contains(self, keys):
+        "Yields whether each of ``keys`` is in the DAWG."
+        return self.map("__contains__", keys)
+
+    def get(self, keys, default=None):
+        "Yields the value of each of ``keys`` (or ``default``)."
+        return self.map("get", keys, default)
+
+    def keys(self, prefixes):
+        "Yields the list of keys starting with each of ``prefixes``."
+        return self.map("keys", prefixes)
+
+    def similar_keys(self, keys, replaces):
+        "Yields the ``similar_keys`` of each of ``keys``."
+        return self.map("similar_keys", keys, replaces)
+
+    def close(self):
+        self._pool.shutdown()
+        with _readers_lock:
+            readers = _open_readers.pop(self._spec[0], ())
+        for reader in readers:
+            reader.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
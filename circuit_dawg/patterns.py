@@ -0,0 +1,442 @@
+"""
+Pattern automata for searching DAWG keys
+"""
+
+
+class Automaton:
+    """
+    Base class of the automata walked by ``CompletionDAWG.match()``. A
+    state is a frozenset of positions in a pattern; subclasses define
+    ``_closure``, ``_advance`` and ``_is_final``.
+
+    Transitions are cached, so the automaton is determinized lazily: each
+    (state, character) pair met while walking a DAWG is computed once.
+    """
+
+    def __init__(self):
+        self._transitions = {}
+        self._accepting = {}
+        self._literals = {}
+
+    def start(self):
+        "Returns the start state, or None if nothing can match."
+        return self._closure([0]) or None
+
+    def step(self, state, char):
+        "Returns the state after ``char``, or None if nothing can match."
+        key = (state, char)
+        if key not in self._transitions:
+            self._transitions[key] = self._closure(self._advance(state, char)) or None
+        return self._transitions[key]
+
+    def accepts(self, state):
+        "Returns whether a key ending in ``state`` matches."
+        if state not in self._accepting:
+            self._accepting[state] = any(self._is_final(pos) for pos in state)
+        return self._accepting[state]
+
+    def literals(self, state):
+        """
+        Returns the characters that can follow ``state`` in ascending
+        order when they are finitely many, or None when any character
+        might.
+        """
+        if state not in self._literals:
+            self._literals[state] = self._find_literals(state)
+        return self._literals[state]
+
+    def _find_literals(self, state):
+        chars = set()
+        for pos in state:
+            pos_chars = self._literals_at(pos)
+            if pos_chars is None:
+                return None
+            chars.update(pos_chars)
+        return sorted(chars)
+
+
+# Tokens matching any character (or repeating); distinct from every literal.
+ANY = object()
+STAR = object()
+
+
+def _class_matches(token, char):
+    negate, chars, ranges = token
+    found = char in chars or any(lo <= char <= hi for lo, hi in ranges)
+    return found != negate
+
+
+def _parse_class(pattern, pos):
+    """
+    Parses the character class starting after the ``[`` at ``pos - 1``.
+    Returns ((negate, chars, ranges), end position), or None if the class
+    isn't closed.
+    """
+    negate = pattern[pos : pos + 1] in ("!", "^")
+    start = pos + 1 if negate else pos
+    # A "]" right after the opening bracket is a literal.
+    end = pattern.find("]", start + 1)
+    if end < 0:
+        return None
+
+    chars = ""
+    ranges = []
+    body = pattern[start:end]
+    i = 0
+    while i < len(body):
+        if i + 2 < len(body) and body[i + 1] == "-":
+            ranges.append((body[i], body[i + 2]))
+            i += 3
+        else:
+            chars += body[i]
+            i += 1
+    return (negate, chars, ranges), end + 1
+
+
+class Wildcard(Automaton):
+    """
+    Shell-style pattern: ``?`` matches one character, ``*`` any number
+    of them and ``[...]`` one character of a class such as ``[aeiou]``,
+    ``[a-z]`` or ``[!0-9]``. Every other character matches itself.
+    """
+
+    STAR = STAR
+    ANY = ANY
+
+    def __init__(self, pattern):
+        super().__init__()
+        self.pattern = pattern
+        # Tokens are literal characters, STAR, ANY or class tuples.
+        self._tokens = tokens = []
+        pos = 0
+        while pos < len(pattern):
+            char = pattern[pos]
+            pos += 1
+            parsed = _parse_class(pattern, pos) if char == "[" else None
+            if parsed is not None:
+                token, pos = parsed
+                tokens.append(token)
+            elif char == "*":
+                if not tokens or tokens[-1] is not self.STAR:
+                    tokens.append(self.STAR)
+            elif char == "?":
+                tokens.append(self.ANY)
+            else:
+                tokens.append(char)
+
+    def _closure(self, positions):
+        res = set()
+        for pos in positions:
+            res.add(pos)
+            while pos < len(self._tokens) and self._tokens[pos] is self.STAR:
+                pos += 1
+                res.add(pos)
+        return frozenset(res)
+
+    def _advance(self, state, char):
+        res = []
+        for pos in state:
+            if pos == len(self._tokens):
+                continue
+            token = self._tokens[pos]
+            if token is self.STAR:
+                res.append(pos)
+            elif token is self.ANY:
+                res.append(pos + 1)
+            elif isinstance(token, tuple):
+                if _class_matches(token, char):
+                    res.append(pos + 1)
+            elif token == char:
+                res.append(pos + 1)
+        return res
+
+    def _is_final(self, pos):
+        return pos == len(self._tokens)
+
+    def _literals_at(self, pos):
+        if pos == len(self._tokens):
+            return ()
+        token = self._tokens[pos]
+        if token is self.STAR or token is self.ANY:
+            return None
+        if isinstance(token, tuple):
+            negate, chars, ranges = token
+            if negate or ranges:
+                return None
+            return chars
+        return (token,)
+
+
+_ESCAPES = {
+    "d": (False, "", [("0", "9")]),
+    "w": (False, "_", [("a", "z"), ("A", "Z"), ("0", "9")]),
+    "s": (False, " \t\n\r\f\v", []),
+}
+_CONTROL_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "f": "\f", "v": "\v"}
+
+
+class Regex(Automaton):
+    """
+    Regular expression matched against whole keys. The supported subset
+    is literals, ``.``, classes (``[a-z]``, ``[^...]``), ``\\d``, ``\\w``
+    and ``\\s`` (ASCII only) and their negations, groups, ``|``, and the
+    ``*``, ``+``, ``?`` and ``{m,n}`` quantifiers. ``^`` and ``$`` are
+    only allowed at the ends of the pattern.
+
+    The pattern is parsed into a tree and compiled into an NFA whose
+    nodes are ``(test, next)`` character transitions or lists of epsilon
+    transitions; node 0 is the start and ``_final`` the accepting node.
+    """
+
+    ANY = ANY
+
+    def __init__(self, pattern):
+        super().__init__()
+        self.pattern = pattern
+        self._pos = 0
+        if pattern.startswith("^"):
+            self._pos = 1
+        end = len(pattern)
+        if pattern.endswith("$") and end > self._pos:
+            # An odd run of backslashes before it escapes the final ``$``.
+            body = pattern[self._pos : end - 1]
+            if not (len(body) - len(body.rstrip("\\"))) % 2:
+                end -= 1
+        self._end = end
+        tree = self._parse_alt()
+        if self._pos != self._end:
+            raise ValueError(f"Unbalanced parenthesis in {pattern!r}")
+
+        self._nodes = [[]]
+        start, end = self._compile(tree)
+        self._nodes[0].append(start)
+        self._final = end
+
+    # Parser: every method returns a tree node, one of ("lit", test),
+    # ("cat", nodes), ("alt", nodes) and ("rep", node, min, max or None).
+
+    def _peek(self):
+        if self._pos < self._end:
+            return self.pattern[self._pos]
+        return None
+
+    def _parse_alt(self):
+        branches = [self._parse_cat()]
+        while self._peek() == "|":
+            self._pos += 1
+            branches.append(self._parse_cat())
+        return ("alt", branches) if len(branches) > 1 else branches[0]
+
+    def _parse_cat(self):
+        items = []
+        while self._peek() not in (None, "|", ")"):
+            items.append(self._parse_repeat())
+        return ("cat", items)
+
+    def _parse_repeat(self):
+        node = self._parse_atom()
+        while True:
+            char = self._peek()
+            if char in ("*", "+", "?"):
+                bounds = {"*": (0, None), "+": (1, None), "?": (0, 1)}[char]
+                self._pos += 1
+            elif char == "{" and self._parse_bounds() is not None:
+                bounds, self._pos = self._parse_bounds()
+            else:
+                return node
+            if self._peek() == "?":
+                # Lazy quantifiers match the same set of whole keys.
+                self._pos += 1
+            node = ("rep", node, bounds[0], bounds[1])
+
+    def _parse_bounds(self):
+        end = self.pattern.find("}", self._pos, self._end)
+        if end < 0:
+            return None
+        low, sep, high = self.pattern[self._pos + 1 : end].partition(",")
+        if not (low or sep) or (low and not low.isdigit()) or (high and not high.isdigit()):
+            return None
+        low = int(low) if low else 0
+        high = int(high) if high else (None if sep else low)
+        if high is not None and high < low:
+            raise ValueError(f"Bad repeat bounds in {self.pattern!r}")
+        return (low, high), end + 1
+
+    def _parse_atom(self):
+        char = self._peek()
+        self._pos += 1
+        if char == "(":
+            if self.pattern.startswith("?:", self._pos):
+                self._pos += 2
+            node = self._parse_alt()
+            if self._peek() != ")":
+                raise ValueError(f"Unbalanced parenthesis in {self.pattern!r}")
+            self._pos += 1
+            return node
+        if char in ("*", "+", "?"):
+            raise ValueError(f"Nothing to repeat in {self.pattern!r}")
+        if char in ("^", "$"):
+            raise ValueError(f"Anchor {char} inside {self.pattern!r} is not supported")
+        if char == "{":
+            self._pos -= 1
+            repeat = self._parse_bounds()
+            self._pos += 1
+            if repeat is not None:
+                raise ValueError(f"Nothing to repeat in {self.pattern!r}")
+        if char == ".":
+            return ("lit", self.ANY)
+        if char == "[":
+            return ("lit", self._parse_class())
+        if char == "\\":
+            return ("lit", self._parse_escape())
+        return ("lit", char)
+
+    def _parse_escape(self):
+        if self._pos >= self._end:
+            raise ValueError(f"Trailing backslash in {self.pattern!r}")
+        char = self.pattern[self._pos]
+        self._pos += 1
+        if char.lower() in _ESCAPES:
+            _, chars, ranges = _ESCAPES[char.lower()]
+            return (char.isupper(), chars, ranges)
+        if char in _CONTROL_ESCAPES:
+            return _CONTROL_ESCAPES[char]
+        if char.isalpha() or char.isdigit():
+            raise ValueError(f"Unsupported escape \\{char} in {self.pattern!r}")
+        return char
+
+    def _parse_class(self):
+        negate = self._peek() == "^"
+        if negate:
+            self._pos += 1
+        chars = ""
+        ranges = []
+        first = True
+        while True:
+            char = self._peek()
+            if char is None:
+                raise ValueError(f"Unterminated character class in {self.pattern!r}")
+            self._pos += 1
+            if char == "]" and not first:
+                return (negate, chars, ranges)
+            first = False
+            if char == "\\":
+                char = self._parse_escape()
+                if isinstance(char, tuple):
+                    if char[0]:
+                        raise ValueError(f"Negated escape in a class in {self.pattern!r}")
+                    chars += char[1]
+                    ranges.extend(char[2])
+                    continue
+            if self._peek() == "-" and self.pattern[self._pos + 1 : self._pos + 2] not in ("]", ""):
+                self._pos += 1
+                high = self._peek()
+                self._pos += 1
+                if high == "\\":
+                    high = self._parse_escape()
+                    if isinstance(high, tuple):
+                        raise ValueError(f"Bad character range in {self.pattern!r}")
+                ranges.append((char, high))
+            else:
+                chars += char
+
+    # Compiler: returns the (start, end) nodes of the NFA for a tree node.
+
+    def _node(self, node):
+        self._nodes.append(node)
+        return len(self._nodes) - 1
+
+    def _compile(self, tree):
+        kind = tree[0]
+        if kind == "lit":
+            end = self._node([])
+            return self._node((tree[1], end)), end
+        if kind == "cat":
+            start = end = self._node([])
+            for item in tree[1]:
+                item_start, item_end = self._compile(item)
+                self._nodes[end].append(item_start)
+                end = item_end
+            return start, end
+        if kind == "alt":
+            start = self._node([])
+            end = self._node([])
+            for branch in tree[1]:
+                branch_start, branch_end = self._compile(branch)
+                self._nodes[start].append(branch_start)
+                self._nodes[branch_end].append(end)
+            return start, end
+
+        _, item, low, high = tree
+        start = end = self._node([])
+        for _ in range(low):
+            item_start, item_end = self._compile(item)
+            self._nodes[end].append(item_start)
+            end = item_end
+        if high is None:
+            item_start, item_end = self._compile(item)
+            self._nodes[end].append(item_start)
+            self._nodes[item_end].append(item_start)
+            self._nodes[item_end].append(self._node([]))
+            last = self._nodes[item_end][-1]
+            self._nodes[end].append(last)
+            return start, last
+        last = self._node([])
+        for _ in range(high - low):
+            self._nodes[end].append(last)
+            item_start, item_end = self._compile(item)
+            self._nodes[end].append(item_start)
+            end = item_end
+        self._nodes[end].append(last)
+        return start, last
+
+    def _closure(self, positions):
+        # Keeps the character transitions and the final node reached.
+        res = set()
+        seen = set()
+        stack = list(positions)
+        while stack:
+            pos = stack.pop()
+            if pos in seen:
+                continue
+            seen.add(pos)
+            node = self._nodes[pos]
+            if isinstance(node, list):
+                stack.extend(node)
+                if pos == self._final:
+                    res.add(pos)
+            else:
+                res.add(pos)
+        return frozenset(res)
+
+    def _advance(self, state, char):
+        res = []
+        for pos in state:
+            if pos == self._final:
+                continue
+            test, target = self._nodes[pos]
+            if test is self.ANY:
+                if char != "\n":
+                    res.append(target)
+            elif isinstance(test, tuple):
+                if _class_matches(test, char):
+                    res.append(target)
+            elif test == char:
+                res.append(target)
+        return res
+
+    def _is_final(self, pos):
+        return pos == self._final
+
+    def _literals_at(self, pos):
+        if pos == self._final:
+            return ()
+        test = self._nodes[pos][0]
+        if test is self.ANY:
+            return None
+        if isinstance(test, tuple):
+            negate, chars, ranges = test
+            if negate or ranges:
+                return None
+            return chars
+        return (test,)
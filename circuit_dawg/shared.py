@@ -0,0 +1,132 @@
+"""
+Publish a loaded DAWG into ``multiprocessing.shared_memory`` so that every
+worker process on a host reads the same physical copy.
+
+The publishing process calls ``publish(dawg)`` and passes the picklable
+``handle`` to its workers, which call ``handle.attach()`` to build a DAWG
+of the same class over the shared block without copying it.
+"""
+
+import os
+from multiprocessing import shared_memory
+
+from .dawgs import BytesDAWG, RecordDAWG
+
+# SharedMemory blocks attached by this process, by name.
+_attached = {}
+# Names of the blocks created by this process (and inherited by forked
+# workers), whose resource tracker registration must be kept.
+_created = set()
+
+
+def _init_args(dawg):
+    if isinstance(dawg, RecordDAWG):
+        return (dawg.fmt, dawg._payload_separator)
+    if isinstance(dawg, BytesDAWG):
+        return (dawg._payload_separator,)
+    return ()
+
+
+def _tracker_id():
+    """
+    Identifies the resource tracker of this process by the pipe it is
+    reached through, or returns None where blocks are not tracked.
+    Worker processes started by ``multiprocessing`` share their parent's
+    tracker, and so its pipe.
+    """
+    if os.name != "posix":
+        return None
+    from multiprocessing import resource_tracker
+
+    stat = os.fstat(resource_tracker.getfd())
+    return stat.st_dev, stat.st_ino
+
+
+def _open(name, tracker):
+    try:
+        # Python 3.13+: attaching must not register the block for cleanup.
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        # Attaching registered the block with this process's tracker, which
+        # would unlink it when this process exits. A tracker shared with the
+        # publisher already holds the publisher's registration: removing it
+        # would make the publisher's unlink fail and leak the block if the
+        # publisher crashed.
+        if name not in _created and tracker != _tracker_id():
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+class SharedDAWGHandle:
+    """
+    Picklable reference to a DAWG published in shared memory.
+    """
+
+    def __init__(self, name, size, dawg_class, dawg_args=(), tracker=None):
+        self.name = name
+        self.size = size
+        self.dawg_class = dawg_class
+        self.dawg_args = dawg_args
+        # Resource tracker of the publishing process (see ``_tracker_id``).
+        self.tracker = tracker
+
+    def attach(self):
+        """
+        Returns a new DAWG reading the shared block in place. The block is
+        attached once per process and shared by every DAWG built from it.
+        """
+        shm = _attached.get(self.name)
+        if shm is None:
+            shm = _attached[self.name] = _open(self.name, self.tracker)
+        return self.dawg_class(*self.dawg_args).frombytes(shm.buf[: self.size])
+
+    def detach(self):
+        """
+        Detaches this process from the shared block. Every DAWG returned by
+        ``attach()`` must be closed first.
+        """
+        shm = _attached.pop(self.name, None)
+        if shm is not None:
+            shm.close()
+
+
+class SharedDAWG:
+    """
+    Owner of a shared memory block holding a published DAWG. Closing it
+    unlinks the block; attached workers keep their mapping until they
+    detach.
+    """
+
+    def __init__(self, dawg):
+        data = dawg.tobytes()
+        self._shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        self._shm.buf[: len(data)] = data
+        _created.add(self._shm.name)
+        self.handle = SharedDAWGHandle(
+            self._shm.name, len(data), type(dawg), _init_args(dawg), _tracker_id()
+        )
+
+    def close(self):
+        if self._shm is not None:
+            self.handle.detach()
+            self._shm.close()
+            self._shm.unlink()
+            _created.discard(self._shm.name)
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def publish(dawg):
+    """
+    Copies the loaded ``dawg`` into a new shared memory block and returns
+    the owning ``SharedDAWG``; pass its ``handle`` to worker processes.
+    """
+    return SharedDAWG(dawg)
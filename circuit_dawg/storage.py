@@ -0,0 +1,109 @@
+"""
+Storage backends which present remote DAWG files as seekable binary file
+objects, so they can be passed to ``DAWG.read()`` like a local file.
+
+Combine them with the page cache of the ``"file"`` backend
+(``cache_blocks``/``block_size``) so that each aligned block is fetched
+once and neighbouring units are served from it.
+"""
+
+import http.client
+from urllib.parse import urlsplit
+
+
+class HTTPRangeFile:
+    """
+    Read-only, seekable file object over an HTTP(S) URL. Every read()
+    becomes a single ``Range`` request on one reused keep-alive connection.
+
+    If the server ignores ``Range`` and answers with the whole file, the
+    body is kept in memory and later reads are served from it. ``requests``
+    counts every request sent, including reconnection retries.
+    """
+
+    def __init__(self, url, timeout=30):
+        parts = urlsplit(url)
+        if parts.scheme == "https":
+            connection_class = http.client.HTTPSConnection
+        elif parts.scheme == "http":
+            connection_class = http.client.HTTPConnection
+        else:
+            raise ValueError(f"Unsupported URL scheme: {parts.scheme!r}")
+
+        self.name = url
+        self._conn = connection_class(parts.hostname, parts.port, timeout=timeout)
+        self._target = parts.path or "/"
+        if parts.query:
+            self._target += "?" + parts.query
+        self.pos = 0
+        self.requests = 0
+        self.closed = False
+        self._body = None
+
+    def seekable(self):
+        return True
+
+    def readable(self):
+        return True
+
+    def tell(self):
+        return self.pos
+
+    def seek(self, pos, whence=0):
+        if whence == 1:
+            pos += self.pos
+        elif whence == 2:
+            raise OSError("HTTPRangeFile can't seek relative to the end")
+        self.pos = pos
+        return self.pos
+
+    def read(self, size=-1):
+        if size == 0:
+            return b""
+        if self._body is None:
+            if size < 0:
+                byte_range = f"bytes={self.pos}-"
+            else:
+                byte_range = f"bytes={self.pos}-{self.pos + size - 1}"
+
+            status, data = self._get(byte_range)
+            if status == 200:
+                # The server ignored the Range header and sent the whole
+                # file; keep it and serve this and every later read from it.
+                self._body = data
+            elif status == 416:
+                # Range starts past the end of the file.
+                data = b""
+            elif status != 206:
+                raise OSError(f"HTTP {status} while reading {self.name}")
+
+        if self._body is not None:
+            end = self.pos + size if size > 0 else len(self._body)
+            data = self._body[self.pos : end]
+        self.pos += len(data)
+        return data
+
+    def _get(self, byte_range):
+        headers = {"Range": byte_range}
+        try:
+            self.requests += 1
+            self._conn.request("GET", self._target, headers=headers)
+            response = self._conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server dropped the idle keep-alive connection; reconnect once.
+            self._conn.close()
+            self.requests += 1
+            self._conn.request("GET", self._target, headers=headers)
+            response = self._conn.getresponse()
+        return response.status, response.read()
+
+    def close(self):
+        if not self.closed:
+            self._conn.close()
+            self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
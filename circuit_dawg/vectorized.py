@@ -0,0 +1,193 @@
+"""
+Vectorized batch lookups with NumPy.
+
+``VectorLookup`` loads the dictionary units of a ``DAWG`` or ``IntDAWG``
+into an ``np.uint32`` array and advances a whole vector of keys one byte
+position at a time, so checking millions of keys costs a few NumPy
+operations per byte position instead of a Python loop per key.
+
+``items_columnar()`` and ``get_many_columnar()`` decode the records of a
+``RecordDAWG`` into NumPy arrays in one ``np.frombuffer`` call.
+
+NumPy is an optional dependency (``pip install circuit-dawg[numpy]``);
+nothing else in the package imports this module.
+"""
+
+import struct
+
+import numpy as np
+
+from . import units, wrapper
+from .dawgs import _struct_tokens
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def load_units(dct):
+    """
+    Returns the units of a loaded ``wrapper.Dictionary`` as an ``np.uint32``
+    array, sharing memory with the in-RAM and buffer backends.
+    """
+    assert isinstance(dct.fp, wrapper.FilePointer), "load() must be called before using DAWG"
+    fp = dct.fp
+    if isinstance(fp, wrapper.ArrayPointer):
+        return np.frombuffer(fp.units, dtype=np.uint32)
+    if isinstance(fp, wrapper.BufferPointer):
+        return np.frombuffer(fp.buf, dtype=np.uint32, count=fp.base_size, offset=fp.skip)
+    fp.seek(0)
+    return np.frombuffer(fp.read(fp.base_size * 4), dtype=np.uint32)
+
+
+def has_leaf(base):
+    "Vectorized ``units.has_leaf``."
+    return (base & units.HAS_LEAF_BIT) != 0
+
+
+# units.offset, units.label and units.value are plain bitwise expressions,
+# so they already work element-wise on uint32 arrays.
+offset = units.offset
+label = units.label
+value = units.value
+
+
+class VectorLookup:
+    """
+    Lockstep membership and value lookups for ``DAWG`` and ``IntDAWG``.
+
+    Keys are processed in chunks of ``chunk_size`` so that the padded
+    byte matrix of each chunk stays small. With the ``"array"``, ``"mmap"``
+    and in-memory backends the units are shared rather than copied, so drop
+    the ``VectorLookup`` before closing the DAWG.
+    """
+
+    def __init__(self, dawg, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.units = load_units(dawg.dct)
+        self.chunk_size = chunk_size
+
+    def contains(self, keys):
+        "Returns a boolean array telling whether each of ``keys`` is present."
+        res = np.zeros(len(keys), dtype=bool)
+        for start, index, found in self._walk(keys):
+            res[start : start + len(index)] = found
+        return res
+
+    def values(self, keys, default=-1):
+        """
+        Returns an ``np.int64`` array with the value of each of ``keys``
+        (``default`` for missing keys).
+        """
+        res = np.full(len(keys), default, dtype=np.int64)
+        for start, index, found in self._walk(keys):
+            index = index[found]
+            value_index = index ^ offset(self.units[index])
+            chunk = res[start : start + len(found)]
+            chunk[found] = value(self.units[value_index])
+        return res
+
+    def _walk(self, keys):
+        """
+        Yields ``(start, index, found)`` per chunk of ``keys``: the final
+        index of every key and whether it ended on a key of the DAWG.
+        """
+        for start in range(0, len(keys), self.chunk_size):
+            chunk = [
+                key if isinstance(key, bytes) else key.encode("utf8")
+                for key in keys[start : start + self.chunk_size]
+            ]
+            index, alive = self._follow(chunk)
+            found = alive & has_leaf(self.units[index])
+            yield start, index, found
+
+    def _follow(self, b_keys):
+        lengths = np.fromiter(map(len, b_keys), dtype=np.int64, count=len(b_keys))
+        width = int(lengths.max()) if len(b_keys) else 0
+        index = np.zeros(len(b_keys), dtype=np.uint32)
+        alive = np.ones(len(b_keys), dtype=bool)
+        if not width:
+            return index, alive
+
+        matrix = np.array(b_keys, dtype=f"S{width}").view(np.uint8)
+        matrix = matrix.reshape(len(b_keys), width)
+
+        units_ = self.units
+        for pos in range(width):
+            # Keys that are finished or already failed don't move.
+            active = np.flatnonzero(alive & (lengths > pos))
+            if not len(active):
+                break
+            current = index[active]
+            labels = matrix[active, pos].astype(np.uint32)
+            next_index = current ^ offset(units_[current]) ^ labels
+            ok = label(units_[next_index]) == labels
+            index[active[ok]] = next_index[ok]
+            alive[active[~ok]] = False
+
+        return index, alive
+
+
+# NumPy kinds of the struct integer and float codes, for formats with
+# standard sizes.
+_STANDARD_KINDS = {code: "i" for code in "bhilq"}
+_STANDARD_KINDS.update({code: "u" for code in "BHILQ"})
+_STANDARD_KINDS.update({code: "f" for code in "efd"})
+_BYTE_ORDERS = {"<": "<", ">": ">", "!": ">", "=": "="}
+
+
+def record_dtype(fmt):
+    """
+    Returns a structured dtype with fields ``f0``, ``f1``, ... laid out
+    exactly like the records of the struct format ``fmt``.
+    """
+    order, tokens = _struct_tokens(str(fmt))
+    names, formats, offsets = [], [], []
+    layout = order
+    for token in tokens:
+        code = token[-1]
+        if code != "x":
+            # struct pads before a field, never after the last one.
+            offsets.append(struct.calcsize(layout + token) - struct.calcsize(order + token))
+            names.append(f"f{len(names)}")
+            formats.append(_field_format(order, token))
+        layout += token
+    return np.dtype(
+        {"names": names, "formats": formats, "offsets": offsets, "itemsize": struct.calcsize(str(fmt))}
+    )
+
+
+def _field_format(order, token):
+    code = token[-1]
+    if code == "s":
+        return f"S{token[:-1] or 1}"
+    if code == "c":
+        return "S1"
+    if code == "?":
+        return "?"
+    if order == "@" and code in "bBhHiIlLqQefd":
+        return code
+    if code in _STANDARD_KINDS:
+        return f"{_BYTE_ORDERS[order]}{_STANDARD_KINDS[code]}{struct.calcsize(order + code)}"
+    raise ValueError(f"struct format code {code!r} has no NumPy equivalent")
+
+
+def items_columnar(dawg, prefix=""):
+    """
+    Like ``RecordDAWG.items_columnar()``, but the columns are NumPy views
+    into a single structured array decoded straight from the packed
+    records.
+    """
+    keys, packed = dawg._packed_items(prefix)
+    return keys, _columns(packed, dawg.fmt)
+
+
+def get_many_columnar(dawg, keys):
+    """
+    Like ``RecordDAWG.get_many_columnar()``, returning the offsets as an
+    ``np.int64`` array and the columns as NumPy views.
+    """
+    offsets, packed = dawg._packed_many(keys)
+    return np.array(offsets, dtype=np.int64), _columns(packed, dawg.fmt)
+
+
+def _columns(packed, fmt):
+    records = np.frombuffer(packed, dtype=record_dtype(fmt))
+    return [records[name] for name in records.dtype.names]
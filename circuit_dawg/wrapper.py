@@ -1,13 +1,23 @@
 import struct
 from . import units
 
+_UNIT_TYPECODE = "I" if struct.calcsize("I") == 4 else "L"
+
+DEFAULT_BLOCK_SIZE = 512
+
+
 class FilePointer:
     """
     FilePointer class to allow for skipping the first 4 bytes of
     the file (which is the root index of the DAWG).
     """
 
-    def __init__(self, fp, skip=0):
+    _blocks = None
+    hits = 0
+    misses = 0
+    evictions = 0
+
+    def __init__(self, fp, skip=0, cache_blocks=0, block_size=DEFAULT_BLOCK_SIZE):
         self.fp = fp
         self.fp.seek(0 + skip)
         self.base_size = struct.unpack(str("=I"), fp.read(4))[0]
@@ -15,6 +25,20 @@ class FilePointer:
             skip + 4
         )  # The first # bytes that belong to other models and the base_size
 
+        # Optional LRU page cache: up to ``cache_blocks`` aligned blocks of
+        # ``block_size`` bytes serve unit() and byte() reads.
+        self.cache_blocks = cache_blocks
+        self.block_size = block_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if cache_blocks:
+            from collections import OrderedDict
+
+            self._blocks = OrderedDict()
+        else:
+            self._blocks = None
+
     def read(self, size):
         return self.fp.read(size)
 
@@ -23,9 +47,252 @@ class FilePointer:
         adjusted_pos = self.skip + pos
         return self.fp.seek(adjusted_pos)
 
+    def unit(self, index):
+        "Reads the 4-byte unit at ``index``."
+        if self._blocks is not None:
+            return struct.unpack("=I", self._cached(self.skip + index * 4, 4))[0]
+        self.seek(index * 4)
+        return struct.unpack("=I", self.fp.read(4))[0]
+
+    def byte(self, pos):
+        "Reads the single byte at ``pos``."
+        if self._blocks is not None:
+            return self._cached(self.skip + pos, 1)[0]
+        self.seek(pos)
+        return self.fp.read(1)[0]
+
+    def cache_info(self):
+        "Returns page cache counters."
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "blocks": len(self._blocks) if self._blocks is not None else 0,
+        }
+
+    def _block(self, number):
+        blocks = self._blocks
+        block = blocks.pop(number, None)
+        if block is None:
+            self.misses += 1
+            self.fp.seek(number * self.block_size)
+            block = self.fp.read(self.block_size)
+            if len(blocks) >= self.cache_blocks:
+                # Evicts the least recently used block.
+                blocks.pop(next(iter(blocks)))
+                self.evictions += 1
+        else:
+            self.hits += 1
+        blocks[number] = block
+        return block
+
+    def _cached(self, pos, size):
+        number, start = divmod(pos, self.block_size)
+        block = self._block(number)
+        end = start + size
+        if end <= len(block) or len(block) < self.block_size:
+            return block[start:end]
+        # The read straddles a block boundary.
+        return block[start:] + self._cached(
+            (number + 1) * self.block_size, end - len(block)
+        )
+
+    def crc32(self, width, chunk_size=1 << 16):
+        """
+        Returns the CRC-32 of the ``width``-byte entries of this section,
+        read ``chunk_size`` bytes at a time.
+        """
+        from binascii import crc32
+
+        crc = 0
+        end = self.base_size * width
+        for pos in range(0, end, chunk_size):
+            self.seek(pos)
+            crc = crc32(self.read(min(chunk_size, end - pos)), crc)
+        return crc
+
+    def tobytes(self, width):
+        """
+        Returns this section of the file (the base_size header followed by
+        ``width`` bytes per entry) as bytes.
+        """
+        self.fp.seek(self.skip - 4)
+        return self.fp.read(4 + self.base_size * width)
+
     def close(self):
         if self.fp:
           self.fp.close()
+        if self._blocks is not None:
+            self._blocks.clear()
+
+
+class BufferPointer(FilePointer):
+    """
+    FilePointer over an in-memory buffer (e.g. a memory map) which decodes
+    units in place with ``struct.unpack_from`` instead of seek() and read().
+    """
+
+    def __init__(self, buf, skip=0, fp=None):
+        self.buf = buf
+        self.fp = fp
+        self.base_size = struct.unpack_from("=I", buf, skip)[0]
+        self.skip = skip + 4
+        self.pos = self.skip
+
+    def read(self, size):
+        start = self.pos
+        self.pos += size
+        return bytes(self.buf[start:self.pos])
+
+    def seek(self, pos):
+        self.pos = self.skip + pos
+        return self.pos
+
+    def unit(self, index):
+        return struct.unpack_from("=I", self.buf, self.skip + index * 4)[0]
+
+    def byte(self, pos):
+        return self.buf[self.skip + pos]
+
+    def tobytes(self, width):
+        return bytes(self.buf[self.skip - 4 : self.skip + self.base_size * width])
+
+    def close(self):
+        if hasattr(self.buf, "close"):
+            self.buf.close()
+        elif hasattr(self.buf, "release"):
+            self.buf.release()
+        super().close()
+
+
+def buffer_view(data):
+    """
+    Returns a byte-format ``memoryview`` over ``data`` (``bytes``,
+    ``bytearray``, ``memoryview``, ``mmap`` or any other buffer) without
+    copying it. Closing a pointer over the view never closes ``data``.
+    """
+    view = memoryview(data)
+    if getattr(view, "format", "B") != "B":
+        view = view.cast("B")
+    return view
+
+
+class PreadPointer(FilePointer):
+    """
+    FilePointer which reads with ``os.pread()`` at absolute offsets. It
+    keeps no shared file position for unit() and byte(), so one loaded DAWG
+    can be queried from many threads at once.
+    """
+
+    def __init__(self, fp, skip=0):
+        import os
+
+        self.fp = fp
+        self._fd = fp.fileno()
+        self._pread = os.pread
+        self.base_size = struct.unpack("=I", os.pread(self._fd, 4, skip))[0]
+        self.skip = skip + 4
+        self.pos = self.skip
+
+    def read(self, size):
+        data = self._pread(self._fd, size, self.pos)
+        self.pos += len(data)
+        return data
+
+    def seek(self, pos):
+        self.pos = self.skip + pos
+        return self.pos
+
+    def unit(self, index):
+        return struct.unpack("=I", self._pread(self._fd, 4, self.skip + index * 4))[0]
+
+    def byte(self, pos):
+        return self._pread(self._fd, 1, self.skip + pos)[0]
+
+    def tobytes(self, width):
+        return self._pread(self._fd, 4 + self.base_size * width, self.skip - 4)
+
+
+class ArrayPointer(FilePointer):
+    """
+    FilePointer which eagerly reads its section of the file into RAM:
+    4-byte units into an ``array('I')`` and 2-byte guide entries into
+    ``bytes``, so every read is a plain index operation.
+
+    It keeps no reference to ``fp`` once its section is copied, so
+    ``tobytes`` and ``close`` never touch the file; the caller closes
+    ``fp`` after reading every section it holds.
+    """
+
+    def __init__(self, fp, skip=0, width=4):
+        self.fp = None
+        fp.seek(skip)
+        self.base_size = struct.unpack("=I", fp.read(4))[0]
+        self.skip = skip + 4
+        self.pos = 0
+        data = fp.read(self.base_size * width)
+        if width == 4:
+            from array import array
+
+            self.units = array(_UNIT_TYPECODE)
+            self.units.frombytes(data)
+            self.data = memoryview(self.units).cast("B")
+        else:
+            self.units = None
+            self.data = data
+
+    def read(self, size):
+        start = self.pos
+        self.pos += size
+        return bytes(self.data[start:self.pos])
+
+    def seek(self, pos):
+        self.pos = pos
+        return self.skip + pos
+
+    def unit(self, index):
+        return self.units[index]
+
+    def byte(self, pos):
+        return self.data[pos]
+
+    def tobytes(self, width):
+        return struct.pack("=I", self.base_size) + bytes(self.data)
+
+
+def open_pointer(
+    fp,
+    skip=0,
+    backend="file",
+    width=4,
+    cache_blocks=0,
+    block_size=DEFAULT_BLOCK_SIZE,
+):
+    """
+    Creates a pointer over the open binary file ``fp`` for the given
+    ``backend``: ``"file"`` streams units with seek() and read(),
+    ``"mmap"`` maps the file once and decodes units from the mapping,
+    ``"array"`` reads the whole section (``width`` bytes per entry) into RAM
+    and ``"pread"`` reads units with ``os.pread()`` at absolute offsets.
+
+    Every backend except ``"file"`` is safe to share between threads.
+    ``cache_blocks`` and ``block_size`` configure the page cache of the
+    ``"file"`` backend; the other backends don't use one.
+    """
+    if backend == "file":
+        return FilePointer(
+            fp, skip=skip, cache_blocks=cache_blocks, block_size=block_size
+        )
+    if backend == "pread":
+        return PreadPointer(fp, skip=skip)
+    if backend == "array":
+        return ArrayPointer(fp, skip=skip, width=width)
+    if backend == "mmap":
+        import mmap
+
+        buf = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        return BufferPointer(buf, skip=skip, fp=fp)
+    raise ValueError(f"Unknown backend: {backend!r}")
 
 
 class Dictionary:
@@ -43,21 +310,20 @@ class Dictionary:
     def has_value(self, index):
         "Checks if a given index is related to the end of a key."
         assert isinstance(self.fp, FilePointer), "read() must be called before using Dictionary"
-        self.fp.seek(index * 4)
-        base = struct.unpack("=I", self.fp.read(4))[0]
-        return units.has_leaf(base)
+        return units.has_leaf(self.fp.unit(index))
 
     def value(self, index):
         assert isinstance(self.fp, FilePointer), "read() must be called before using Dictionary"
-        self.fp.seek(index * 4)
-        base = struct.unpack("=I", self.fp.read(4))[0]
-        offset = units.offset(base)
+        offset = units.offset(self.fp.unit(index))
         value_index = (index ^ offset) & units.PRECISION_MASK
-        self.fp.seek(value_index * 4)
-        return units.value(struct.unpack("=I", self.fp.read(4))[0])
-
-    def read(self, fp, path):
-        self.fp = FilePointer(fp)
+        return units.value(self.fp.unit(value_index))
+
+    def read(
+        self, fp, path, backend="file", cache_blocks=0, block_size=DEFAULT_BLOCK_SIZE
+    ):
+        self.fp = open_pointer(
+            fp, backend=backend, cache_blocks=cache_blocks, block_size=block_size
+        )
         self.file_path = path
 
     def contains(self, key):
@@ -79,13 +345,10 @@ class Dictionary:
     def follow_char(self, label, index):
         "Follows a transition"
         assert isinstance(self.fp, FilePointer), "read() must be called before using Dictionary"
-        self.fp.seek(index * 4)
-        base = struct.unpack("=I", self.fp.read(4))[0]
-        offset = units.offset(base)
+        offset = units.offset(self.fp.unit(index))
         next_index = (index ^ offset ^ label) & units.PRECISION_MASK
-        self.fp.seek(next_index * 4)
 
-        new_label = units.label(struct.unpack("=I", self.fp.read(4))[0])
+        new_label = units.label(self.fp.unit(next_index))
         if new_label != label:
             return None
 
@@ -100,14 +363,68 @@ class Dictionary:
 
         return index
 
+    def follow_many(self, keys, index=ROOT):
+        """
+        Follows transitions for each of ``keys`` from ``index`` and yields
+        the index reached (or None) per key. The path of the previous key
+        is reused, so when ``keys`` are sorted every shared prefix is
+        walked only once.
+        """
+        path = [index]  # path[i] is the index after i bytes of the previous key
+        prev = b""
+        failed = False
+        for key in keys:
+            n = min(len(key), len(prev))
+            lcp = 0
+            while lcp < n and key[lcp] == prev[lcp]:
+                lcp += 1
+            prev = key
+
+            if failed and lcp >= len(path):
+                # The transition that failed for the previous key fails here too.
+                yield None
+                continue
+
+            del path[lcp + 1 :]
+            index = path[-1]
+            failed = False
+            for pos in range(len(path) - 1, len(key)):
+                index = self.follow_char(key[pos], index)
+                if index is None:
+                    failed = True
+                    break
+                path.append(index)
+            yield index
+
     @classmethod
-    def load(cls, path):
+    def load(
+        cls, path, backend="file", cache_blocks=0, block_size=DEFAULT_BLOCK_SIZE
+    ):
         dawg = cls()
         dawg.file_path = path
         fp = open(path, "rb")
-        dawg.read(fp, path)
+        dawg.read(fp, path, backend, cache_blocks, block_size)
+        if backend == "array":
+            fp.close()  # Everything was copied into RAM.
+        return dawg
+
+    @classmethod
+    def frombytes(cls, data):
+        "Creates a Dictionary over an in-memory buffer without copying it."
+        dawg = cls()
+        dawg.fp = BufferPointer(buffer_view(data))
         return dawg
 
+    def fingerprint(self):
+        "Returns the CRC-32 of the dictionary units."
+        assert isinstance(self.fp, FilePointer), "read() must be called before using Dictionary"
+        return self.fp.crc32(4)
+
+    def tobytes(self):
+        "Returns the dictionary in its binary file format."
+        assert isinstance(self.fp, FilePointer), "read() must be called before using Dictionary"
+        return self.fp.tobytes(4)
+
     def close(self):
         if self.fp is not None:
             self.fp.close()
@@ -130,18 +447,43 @@ class Guide:
 
     def child(self, index):
         assert isinstance(self.fp, FilePointer), "read() must be called before using Guide"
-        self.fp.seek(index * 2)
-        return struct.unpack("B", self.fp.read(1))[0]
+        return self.fp.byte(index * 2)
 
     def sibling(self, index):
         assert isinstance(self.fp, FilePointer), "read() must be called before using Guide"
-        self.fp.seek(index * 2 + 1)
-        return struct.unpack("B", self.fp.read(1))[0]
-
-    def read(self, fp, path, skip=0):
-        self.fp = FilePointer(fp, skip=skip)
+        return self.fp.byte(index * 2 + 1)
+
+    def read(
+        self,
+        fp,
+        path,
+        skip=0,
+        backend="file",
+        cache_blocks=0,
+        block_size=DEFAULT_BLOCK_SIZE,
+    ):
+        self.fp = open_pointer(
+            fp,
+            skip=skip,
+            backend=backend,
+            width=2,
+            cache_blocks=cache_blocks,
+            block_size=block_size,
+        )
         self.file_path = path
 
+    @classmethod
+    def frombytes(cls, data, skip=0):
+        "Creates a Guide over an in-memory buffer without copying it."
+        guide = cls()
+        guide.fp = BufferPointer(buffer_view(data), skip=skip)
+        return guide
+
+    def tobytes(self):
+        "Returns the guide in its binary file format."
+        assert isinstance(self.fp, FilePointer), "read() must be called before using Guide"
+        return self.fp.tobytes(2)
+
     def close(self):
         if self.fp is not None:
             self.fp.close()
@@ -176,6 +518,63 @@ class Completer:
         else:
             self._index_stack = []
 
+    def start_after(self, index, prefix, key):
+        """
+        Starts like ``start()``, but positioned so that next() returns the
+        first key greater than ``key``. The index stack is rebuilt by
+        walking ``key`` once instead of enumerating the keys before it.
+        """
+        self._seek(index, prefix, key, False)
+
+    def start_at(self, index, prefix, key):
+        """
+        Starts like ``start()``, but positioned so that next() returns the
+        first key greater than or equal to ``key``.
+        """
+        self._seek(index, prefix, key, True)
+
+    def _seek(self, index, prefix, key, inclusive):
+        self.start(index, prefix)
+        if not self._index_stack or not key.startswith(prefix):
+            if key > prefix:
+                # Every key starting with ``prefix`` sorts before ``key``.
+                self._index_stack = []
+            return
+
+        for label in key[len(prefix) :]:
+            next_index = self._dic.follow_char(label, index)
+            if next_index is None:
+                self._follow_above(label)
+                return
+            self.key.append(label)
+            self._index_stack.append(next_index)
+            index = next_index
+
+        if self._dic.has_value(index) and not inclusive:
+            # Same state as right after next() returned ``key``.
+            self._last_index = index
+
+    def _follow_above(self, label):
+        """
+        Follows the first transition from the top of the index stack whose
+        label is greater than ``label``, backtracking to the next sibling
+        of an ancestor when there is none.
+        """
+        index = self._index_stack[-1]
+        child_label = self._guide.child(index)
+        while child_label and child_label < label:
+            child_label = self._guide.sibling(self._dic.follow_char(child_label, index))
+
+        while not child_label:
+            if len(self._index_stack) == 1:
+                self._index_stack = []
+                return
+            child_label = self._guide.sibling(self._index_stack.pop())
+            self.key.pop()
+            index = self._index_stack[-1]
+
+        self._follow(child_label, index)
+
     def next(self):
         "Gets the next key"
 
@@ -236,3 +635,273 @@ class Completer:
 
         self._last_index = index
         return True
+
+
+class ReverseCompleter:
+    """
+    Enumerates keys in descending order. The guide only links each node to
+    its first child and next sibling, so the child labels of every node on
+    the current path are collected and consumed from the largest.
+    """
+
+    def __init__(self, dic, guide):
+        self._dic = dic
+        self._guide = guide
+
+    def value(self):
+        return self._dic.value(self._last_index)
+
+    def start(self, index, prefix=b""):
+        self.key = bytearray(prefix)
+        self._drop = False
+
+        if self._guide.size():
+            self._stack = [(index, self._labels(index))]
+        else:
+            self._stack = []
+
+    def start_before(self, index, prefix, key):
+        """
+        Starts like ``start()``, but positioned so that next() returns the
+        last key less than ``key``.
+        """
+        self.start(index, prefix)
+        if not self._stack or not key.startswith(prefix):
+            if key <= prefix:
+                # Every key starting with ``prefix`` sorts after ``key``.
+                self._stack = []
+            return
+
+        for label in key[len(prefix) :]:
+            labels = self._stack[-1][1]
+            # Only children labelled below ``label`` sort before ``key``.
+            while labels and labels[-1] >= label:
+                labels.pop()
+            index = self._dic.follow_char(label, index)
+            if index is None:
+                return
+            self.key.append(label)
+            self._stack.append((index, self._labels(index)))
+
+        # ``key`` itself and the keys it is a prefix of don't sort before it.
+        self._stack.pop()
+        if self._stack:
+            self.key.pop()
+
+    def _labels(self, index):
+        "Returns the child labels of ``index`` in ascending order."
+        labels = []
+        label = self._guide.child(index)
+        while label:
+            labels.append(label)
+            label = self._guide.sibling(self._dic.follow_char(label, index))
+        return labels
+
+    def next(self):
+        "Gets the previous key"
+        if self._drop:
+            self.key.pop()
+            self._drop = False
+
+        while self._stack:
+            index, labels = self._stack[-1]
+            if labels:
+                label = labels.pop()
+                index = self._dic.follow_char(label, index)
+                self.key.append(label)
+                self._stack.append((index, self._labels(index)))
+                continue
+
+            # Every key below ``index`` is done; the node itself comes last.
+            self._stack.pop()
+            has_label = bool(self._stack)
+            if self._dic.has_value(index):
+                self._last_index = index
+                self._drop = has_label
+                return True
+            if has_label:
+                self.key.pop()
+
+        return False
+
+
+class Counts:
+    """
+    Sidecar index holding the number of keys below every dictionary unit
+    and, optionally, the min, max and sum of their values.
+
+    The file is a base_size header followed by 4-byte units: a flags unit,
+    the dictionary size ``n``, the dictionary fingerprint, ``n`` counts
+    and, with ``AGGREGATES``, ``n`` minimums, ``n`` maximums and ``n`` sums
+    as (low, high) unit pairs.
+    """
+
+    AGGREGATES = 1
+    # Units before the counts: flags, dictionary size and fingerprint.
+    HEADER_SIZE = 3
+
+    def __init__(self):
+        self.fp = None
+        self.file_path = None
+
+    def count(self, index):
+        "Returns the number of keys below ``index``."
+        assert isinstance(self.fp, FilePointer), "read() must be called before using Counts"
+        return self.fp.unit(self.HEADER_SIZE + index)
+
+    def has_aggregates(self):
+        assert isinstance(self.fp, FilePointer), "read() must be called before using Counts"
+        return bool(self.fp.unit(0) & self.AGGREGATES)
+
+    def aggregate(self, index):
+        "Returns (count, min, max, sum) of the values below ``index``."
+        assert self.has_aggregates(), "Counts were built without aggregates"
+        size = self.size()
+        start = self.HEADER_SIZE + index
+        count = self.fp.unit(start)
+        if not count:
+            return 0, None, None, 0
+        pos = self.HEADER_SIZE + size * 3 + index * 2
+        return (
+            count,
+            self.fp.unit(start + size),
+            self.fp.unit(start + size * 2),
+            self.fp.unit(pos) | (self.fp.unit(pos + 1) << 32),
+        )
+
+    def size(self):
+        "Returns the size of the dictionary these counts were built for."
+        assert isinstance(self.fp, FilePointer), "read() must be called before using Counts"
+        return self.fp.unit(1)
+
+    def fingerprint(self):
+        "Returns the fingerprint of the dictionary these counts were built for."
+        assert isinstance(self.fp, FilePointer), "read() must be called before using Counts"
+        return self.fp.unit(2)
+
+    def matches(self, dic):
+        "Tells whether these counts were built for the dictionary ``dic``."
+        return self.size() == dic.fp.base_size and self.fingerprint() == dic.fingerprint()
+
+    def read(
+        self, fp, path, backend="file", cache_blocks=0, block_size=DEFAULT_BLOCK_SIZE
+    ):
+        self.fp = open_pointer(
+            fp, backend=backend, cache_blocks=cache_blocks, block_size=block_size
+        )
+        self.file_path = path
+
+    @classmethod
+    def load(
+        cls, path, backend="file", cache_blocks=0, block_size=DEFAULT_BLOCK_SIZE
+    ):
+        counts = cls()
+        if backend == "array":
+            with open(path, "rb") as fp:
+                counts.read(fp, path, backend)
+            return counts
+        # The other backends keep reading from the file, which the counts
+        # then own and close.
+        fp = open(path, "rb")  # noqa: SIM115
+        try:
+            counts.read(fp, path, backend, cache_blocks, block_size)
+        except Exception:
+            fp.close()
+            raise
+        return counts
+
+    @classmethod
+    def frombytes(cls, data):
+        "Creates Counts over an in-memory buffer without copying it."
+        counts = cls()
+        counts.fp = BufferPointer(buffer_view(data))
+        return counts
+
+    @classmethod
+    def build(cls, dic, guide, aggregates=False):
+        """
+        Builds the index for ``dic`` and ``guide`` in one post-order pass.
+        Nodes shared by several keys are visited once: a node always has
+        at least one key below it, so a zero count marks it as unvisited.
+        """
+        from array import array
+
+        size = dic.fp.base_size
+        counts = array(_UNIT_TYPECODE, [0]) * size
+        if aggregates:
+            mins = array(_UNIT_TYPECODE, [0]) * size
+            maxs = array(_UNIT_TYPECODE, [0]) * size
+            sums = array(_UNIT_TYPECODE, [0]) * (size * 2)
+
+        stack = [dic.ROOT] if guide.size() else []
+        while stack:
+            index = stack[-1]
+            children = []
+            pending = False
+            label = guide.child(index)
+            while label:
+                child = dic.follow_char(label, index)
+                children.append(child)
+                if not counts[child]:
+                    stack.append(child)
+                    pending = True
+                label = guide.sibling(child)
+            if pending:
+                continue
+            stack.pop()
+            if counts[index]:
+                # Reached through another parent while it was pending.
+                continue
+
+            count = 0
+            if aggregates:
+                low = high = None
+                total = 0
+            if dic.has_value(index):
+                count = 1
+                if aggregates:
+                    low = high = total = dic.value(index)
+            for child in children:
+                count += counts[child]
+                if aggregates:
+                    if low is None or mins[child] < low:
+                        low = mins[child]
+                    if high is None or maxs[child] > high:
+                        high = maxs[child]
+                    total += sums[child * 2] | (sums[child * 2 + 1] << 32)
+            counts[index] = count
+            if aggregates and count:
+                mins[index] = low
+                maxs[index] = high
+                sums[index * 2] = total & units.PRECISION_MASK
+                sums[index * 2 + 1] = total >> 32
+
+        header = array(
+            _UNIT_TYPECODE, [cls.AGGREGATES if aggregates else 0, size, dic.fingerprint()]
+        )
+        data = bytes(header) + bytes(counts)
+        if aggregates:
+            data += bytes(mins) + bytes(maxs) + bytes(sums)
+        return cls.frombytes(struct.pack("=I", len(data) // 4) + data)
+
+    def tobytes(self):
+        "Returns the index in its binary file format."
+        assert isinstance(self.fp, FilePointer), "read() must be called before using Counts"
+        return self.fp.tobytes(4)
+
+    def save(self, path):
+        "Writes the index to ``path``."
+        with open(path, "wb") as f:
+            f.write(self.tobytes())
+
+    def close(self):
+        if self.fp is not None:
+            self.fp.close()
+            self.fp = None
+            self.file_path = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
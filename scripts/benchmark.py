@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Compare lookup and completion throughput of the circuit_dawg backends.
+
+Usage:
+    python scripts/benchmark.py [path/to/completion.dawg]
+
+The DAWG must be a CompletionDAWG (it needs a guide for ``keys()``).
+Defaults to the 100k word fixture.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from circuit_dawg import CompletionDAWG  # noqa: E402
+
+DEFAULT_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "completion-large.dawg"
+)
+BACKENDS = ["file", "mmap", "array"]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    with CompletionDAWG().load(path) as d:
+        words = d.keys()[::10]
+
+    baseline = {}
+    print(f"{len(words):,} lookups, keys() for prefix 'a' and full keys()\n")
+    print(f"{'backend':<8} {'load':>8} {'lookups':>10} {'prefix':>10} {'keys()':>10}")
+    for backend in BACKENDS:
+        load_time, d = timed(lambda: CompletionDAWG().load(path, backend=backend))
+        lookup_time, _ = timed(lambda: [w in d for w in words])
+        prefix_time, _ = timed(lambda: d.keys("a"))
+        keys_time, _ = timed(d.keys)
+        d.close()
+
+        times = (lookup_time, prefix_time, keys_time)
+        baseline.setdefault("file", times)
+        speedups = " ".join(
+            f"{base / t:>9.1f}x" for base, t in zip(baseline["file"], times)
+        )
+        print(f"{backend:<8} {load_time:>7.3f}s {speedups}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Count how many unit reads the ``"file"`` backend page cache saves.
+
+Usage:
+    python scripts/benchmark_cache.py [path/to/int.dawg] [block_size]
+
+Looks up every word of the 100k word list in an IntDAWG loaded with
+``cache_blocks`` of 8, 16, ... 256 blocks, and prints the number of unit
+reads (cache hits plus misses), the number of real file reads (misses)
+and the time taken.
+"""
+
+import os
+import sys
+import time
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from circuit_dawg import IntDAWG  # noqa: E402
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+DEFAULT_PATH = os.path.join(ROOT, "tests", "fixtures", "int.dawg")
+WORDS_ZIP = os.path.join(ROOT, "tests", "words100k.zip")
+CACHE_BLOCKS = [8, 16, 32, 64, 128, 256]
+
+
+def words100k():
+    zf = zipfile.ZipFile(WORDS_ZIP)
+    txt = zf.open(zf.namelist()[0]).read().decode("utf8")
+    return txt.splitlines()
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    block_size = int(sys.argv[2]) if len(sys.argv) > 2 else 512
+    words = words100k()
+
+    print(f"{len(words):,} lookups, {block_size}-byte blocks\n")
+    print(f"{'blocks':>6} {'unit reads':>11} {'file reads':>11} {'time':>8}")
+    for cache_blocks in CACHE_BLOCKS:
+        with IntDAWG().load(path, cache_blocks=cache_blocks, block_size=block_size) as d:
+            start = time.perf_counter()
+            for word in words:
+                d.get(word)
+            elapsed = time.perf_counter() - start
+            info = d.dct.fp.cache_info()
+        reads = info["hits"] + info["misses"]
+        print(f"{cache_blocks:>6} {reads:>11,} {info['misses']:>11,} {elapsed:>7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
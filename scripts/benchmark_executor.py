@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Measure how QueryExecutor throughput scales with the number of workers.
+
+Usage:
+    python scripts/benchmark_executor.py [path/to/int.dawg]
+
+Runs ``get()`` for every word of the 100k word list against an IntDAWG on
+thread and process pools of 1, 2, 4, ... workers up to the core count.
+Thread pools only scale on free-threaded CPython builds; process pools
+scale on any build.
+"""
+
+import os
+import sys
+import time
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from circuit_dawg import IntDAWG  # noqa: E402
+from circuit_dawg.executor import QueryExecutor  # noqa: E402
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+DEFAULT_PATH = os.path.join(ROOT, "tests", "fixtures", "int.dawg")
+WORDS_ZIP = os.path.join(ROOT, "tests", "words100k.zip")
+
+
+def words100k():
+    zf = zipfile.ZipFile(WORDS_ZIP)
+    txt = zf.open(zf.namelist()[0]).read().decode("utf8")
+    return txt.splitlines()
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    words = words100k()
+    cores = os.cpu_count() or 1
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= cores:
+        worker_counts.append(worker_counts[-1] * 2)
+
+    with IntDAWG().load(path, backend="mmap") as d:
+        start = time.perf_counter()
+        for word in words:
+            d.get(word)
+        sequential = time.perf_counter() - start
+    print(f"{len(words):,} get() calls, sequential: {sequential:.2f}s\n")
+
+    print(f"{'kind':<8} {'workers':>7} {'time':>8} {'speedup':>8}")
+    for kind in ["thread", "process"]:
+        for workers in worker_counts:
+            with QueryExecutor(
+                IntDAWG, path, kind=kind, max_workers=workers, chunk_size=2000
+            ) as ex:
+                start = time.perf_counter()
+                for _ in ex.get(words):
+                    pass
+                elapsed = time.perf_counter() - start
+            print(f"{kind:<8} {workers:>7} {elapsed:>7.2f}s {sequential / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
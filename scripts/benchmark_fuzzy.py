@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Time ``fuzzy_keys`` queries on each backend.
+
+Usage:
+    python scripts/benchmark_fuzzy.py [path/to/completion-large.dawg] [max_distance]
+
+Runs ``fuzzy_keys(word, max_distance)`` for every 1000th word of the 100k
+word list on a CompletionDAWG loaded with the ``"file"``, ``"mmap"``,
+``"pread"`` and ``"array"`` backends, and prints the median and slowest
+query time of each.
+"""
+
+import os
+import sys
+import time
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from circuit_dawg import CompletionDAWG  # noqa: E402
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+DEFAULT_PATH = os.path.join(ROOT, "tests", "fixtures", "completion-large.dawg")
+WORDS_ZIP = os.path.join(ROOT, "tests", "words100k.zip")
+BACKENDS = ["file", "mmap", "pread", "array"]
+
+
+def words100k():
+    zf = zipfile.ZipFile(WORDS_ZIP)
+    txt = zf.open(zf.namelist()[0]).read().decode("utf8")
+    return txt.splitlines()
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    max_distance = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    words = words100k()[::1000]
+
+    print(f"{len(words)} queries, max_distance={max_distance}\n")
+    print(f"{'backend':>7} {'median':>9} {'max':>9}")
+    for backend in BACKENDS:
+        with CompletionDAWG().load(path, backend=backend) as d:
+            times = []
+            for word in words:
+                start = time.perf_counter()
+                d.fuzzy_keys(word, max_distance)
+                times.append(time.perf_counter() - start)
+        times.sort()
+        median = times[len(times) // 2]
+        print(f"{backend:>7} {median * 1000:>7.1f}ms {times[-1] * 1000:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Compare VectorLookup with calling ``get()`` once per key.
+
+Usage:
+    python scripts/benchmark_vectorized.py [path/to/int.dawg]
+
+Looks up every word of the 100k word list in an IntDAWG loaded with the
+``"array"`` backend, first with ``get()`` in a loop and then with
+``VectorLookup.values()``, and checks that both give the same values.
+Needs NumPy.
+"""
+
+import os
+import sys
+import time
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from circuit_dawg import IntDAWG  # noqa: E402
+from circuit_dawg.vectorized import VectorLookup  # noqa: E402
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+DEFAULT_PATH = os.path.join(ROOT, "tests", "fixtures", "int.dawg")
+WORDS_ZIP = os.path.join(ROOT, "tests", "words100k.zip")
+
+
+def words100k():
+    zf = zipfile.ZipFile(WORDS_ZIP)
+    txt = zf.open(zf.namelist()[0]).read().decode("utf8")
+    return txt.splitlines()
+
+
+def best_of(repeat, func):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    words = words100k()
+
+    with IntDAWG().load(path, backend="array") as d:
+        loop_time, expected = best_of(3, lambda: [d.get(word, -1) for word in words])
+        lookup = VectorLookup(d)
+        vector_time, values = best_of(3, lambda: lookup.values(words))
+        assert values.tolist() == expected
+        lookup = None  # drops the NumPy view of the units before closing
+
+    print(f"{len(words):,} lookups, best of 3\n")
+    print(f"get() loop      {loop_time:>7.3f}s")
+    print(f"VectorLookup    {vector_time:>7.3f}s {loop_time / vector_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
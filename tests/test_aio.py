@@ -0,0 +1,110 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from circuit_dawg import BytesDAWG, CompletionDAWG, IntCompletionDAWG, IntDAWG
+from circuit_dawg.aio import AsyncDAWG
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestAsyncDAWG:
+    def test_load_and_get(self):
+        async def main():
+            d = await AsyncDAWG.load(IntDAWG(), os.path.join(FIXTURES_DIR, "int.dawg"))
+            async with d:
+                assert await d.aget("ABC") == 3
+                assert await d.aget("xylophone", -1) == -1
+                assert await d.acontains("ABC")
+            return d
+
+        d = run(main())
+        assert d.dawg.dct is None
+
+    def test_bytes_dawg(self):
+        async def main():
+            path = os.path.join(FIXTURES_DIR, "bytes.dawg")
+            async with await AsyncDAWG.load(BytesDAWG(), path) as d:
+                assert await d.aget("foo") == [b"data1", b"data3"]
+                assert await d.akeys("fo") == ["foo", "foo", "foobar"]
+                assert await d.aitems("foob") == [("foobar", b"data4")]
+
+        run(main())
+
+    @pytest.mark.parametrize("backend", ["file", "pread"])
+    def test_aiterkeys(self, backend):
+        path = os.path.join(FIXTURES_DIR, "completion-large.dawg")
+        with CompletionDAWG().load(path) as reference:
+            expected = reference.keys("co")
+
+        async def main():
+            d = AsyncDAWG(CompletionDAWG().load(path, backend=backend), batch_size=16)
+            async with d:
+                first, second = await asyncio.gather(
+                    collect(d.aiterkeys("co")), collect(d.aiterkeys("co"))
+                )
+            assert first == second == expected
+
+        async def collect(aiter):
+            return [key async for key in aiter]
+
+        run(main())
+
+    def test_aiteritems(self):
+        async def main():
+            path = os.path.join(FIXTURES_DIR, "int-completion.dawg")
+            async with await AsyncDAWG.load(IntCompletionDAWG(), path) as d:
+                return [item async for item in d.aiteritems()]
+
+        assert run(main()) == [("bar", 5), ("foo", 1), ("foobar", 3)]
+
+    def test_yields_to_event_loop(self):
+        path = os.path.join(FIXTURES_DIR, "completion-large.dawg")
+
+        async def main():
+            ticks = 0
+            done = False
+
+            async def ticker():
+                nonlocal ticks
+                while not done:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            task = asyncio.create_task(ticker())
+            async with await AsyncDAWG.load(CompletionDAWG(), path) as d:
+                d.batch_size = 8
+                keys = [key async for key in d.aiterkeys("a")]
+            done = True
+            await task
+            return keys, ticks
+
+        keys, ticks = run(main())
+        assert len(keys) > 100
+        assert ticks > len(keys) // 8
+
+    def test_merges_identical_requests(self):
+        calls = []
+
+        class SlowIntDAWG(IntDAWG):
+            def get(self, key, default=None):
+                calls.append(threading.get_ident())
+                time.sleep(0.05)
+                return super().get(key, default)
+
+        async def main():
+            path = os.path.join(FIXTURES_DIR, "int.dawg")
+            async with await AsyncDAWG.load(SlowIntDAWG(), path) as d:
+                results = await asyncio.gather(*[d.aget("ABC") for _ in range(10)])
+                assert results == [3] * 10
+                assert len(calls) == 1
+                assert await d.aget("ABC", []) == 3  # unhashable default
+
+        run(main())
@@ -0,0 +1,160 @@
+import gc
+import os
+import warnings
+
+import pytest
+
+from circuit_dawg import (
+    DAWG,
+    BytesDAWG,
+    CompletionDAWG,
+    IntCompletionDAWG,
+    IntDAWG,
+    RecordDAWG,
+)
+from circuit_dawg.wrapper import ArrayPointer, BufferPointer, Dictionary
+
+from .utils import words100k
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+BACKENDS = ["mmap", "array", "pread"]
+
+
+def fixture(name):
+    return os.path.join(FIXTURES_DIR, name)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestBackends:
+    """Every backend must return exactly what the default file backend does."""
+
+    def test_dawg(self, backend):
+        with DAWG().load(fixture("dawg.dawg"), backend=backend) as d:
+            for key in ["f", "bar", "foo", "foobar"]:
+                assert key in d
+            assert "fo" not in d
+            assert d.prefixes("foobarz") == ["f", "foo", "foobar"]
+
+    def test_completion_dawg(self, backend):
+        with CompletionDAWG().load(fixture("completion-large.dawg")) as expected:
+            with CompletionDAWG().load(
+                fixture("completion-large.dawg"), backend=backend
+            ) as d:
+                for prefix in ["a", "abc", "co", "re", "zz"]:
+                    assert d.keys(prefix) == expected.keys(prefix)
+                assert list(d.iterkeys("x")) == list(expected.iterkeys("x"))
+
+    def test_empty_completion_dawg(self, backend):
+        with CompletionDAWG().load(fixture("completion-empty.dawg"), backend=backend) as d:
+            assert d.keys() == []
+
+    def test_bytes_dawg(self, backend):
+        with BytesDAWG().load(fixture("bytes.dawg"), backend=backend) as d:
+            assert d["foo"] == [b"data1", b"data3"]
+            assert d.items("foob") == [("foobar", b"data4")]
+            assert "food" not in d
+
+    def test_record_dawg(self, backend):
+        with RecordDAWG(">3H").load(fixture("record.dawg"), backend=backend) as d:
+            assert d["foo"] == [(3, 2, 1), (3, 2, 256)]
+            assert d.keys("fo") == ["foo", "foo", "foobar"]
+
+    def test_int_dawg(self, backend):
+        with IntDAWG().load(fixture("int.dawg"), backend=backend) as d:
+            for word in words100k()[:2000]:
+                assert d[word] == len(word)
+            assert d.get("xylophone") is None
+
+    def test_int_completion_dawg(self, backend):
+        with IntCompletionDAWG().load(
+            fixture("int-completion.dawg"), backend=backend
+        ) as d:
+            assert d.items() == [("bar", 5), ("foo", 1), ("foobar", 3)]
+
+    def test_tobytes(self, backend):
+        for cls, name in [(DAWG, "dawg.dawg"), (CompletionDAWG, "completion.dawg")]:
+            with open(fixture(name), "rb") as f:
+                expected = f.read()
+            with cls().load(fixture(name), backend=backend) as d:
+                assert d.tobytes() == expected
+
+    def test_dictionary(self, backend):
+        with Dictionary.load(fixture("int.dawg"), backend=backend) as d:
+            assert d.find(b"xylophone") == -1
+
+
+class TestMmapBackend:
+    def test_pointer_type(self):
+        with DAWG().load(fixture("dawg.dawg"), backend="mmap") as d:
+            assert isinstance(d.dct.fp, BufferPointer)
+
+    def test_close(self):
+        d = CompletionDAWG().load(fixture("completion.dawg"), backend="mmap")
+        dct_fp, guide_fp = d.dct.fp, d.guide.fp
+        d.close()
+        assert dct_fp.buf.closed
+        with pytest.raises(ValueError):
+            guide_fp.buf[0]
+        assert dct_fp.fp.closed
+
+    def test_single_mapping(self):
+        with CompletionDAWG().load(fixture("completion.dawg"), backend="mmap") as d:
+            assert d.guide.fp.buf.obj is d.dct.fp.buf
+            assert d.keys() == ["bar", "f", "foo", "foobar"]
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            DAWG().load(fixture("dawg.dawg"), backend="tape")
+
+
+class TestArrayBackend:
+    def test_pointer_type(self):
+        with CompletionDAWG().load(fixture("completion.dawg"), backend="array") as d:
+            assert isinstance(d.dct.fp, ArrayPointer)
+            assert isinstance(d.guide.fp, ArrayPointer)
+
+    def test_memory_cost(self):
+        with CompletionDAWG().load(fixture("completion.dawg"), backend="array") as d:
+            assert len(d.dct.fp.data) == d.dct.fp.base_size * 4
+            assert len(d.guide.fp.data) == d.guide.size()
+
+    @pytest.mark.parametrize("cls", [DAWG, CompletionDAWG])
+    def test_file_closed_after_read(self, cls):
+        name = "completion.dawg" if cls is CompletionDAWG else "dawg.dawg"
+        f = open(fixture(name), "rb")  # noqa: SIM115
+        with cls().read(f, backend="array") as d:
+            assert f.closed
+            assert "foo" in d
+            with open(fixture(name), "rb") as expected:
+                assert d.tobytes() == expected.read()
+
+    def test_load_leaves_no_open_file(self, tmp_path):
+        path = str(tmp_path / "completion.counts")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            d = CompletionDAWG().load(fixture("completion.dawg"), backend="array")
+            d.build_counts().save(path)
+            d.load_counts(path, backend="array")
+            del d
+            gc.collect()
+        assert [w for w in caught if issubclass(w.category, ResourceWarning)] == []
+
+
+class TestPageCache:
+    def test_cached_results(self):
+        words = words100k()[:2000]
+        with IntDAWG().load(fixture("int.dawg"), cache_blocks=64, block_size=256) as d:
+            for word in words:
+                assert d[word] == len(word)
+            info = d.dct.fp.cache_info()
+            assert info["blocks"] <= 64
+            assert info["hits"] > info["misses"]
+
+    def test_cached_completion(self):
+        with CompletionDAWG().load(fixture("completion-large.dawg")) as expected:
+            with CompletionDAWG().load(
+                fixture("completion-large.dawg"), cache_blocks=16
+            ) as d:
+                assert d.keys("ab") == expected.keys("ab")
+                assert d.guide.fp.cache_info()["blocks"] <= 16
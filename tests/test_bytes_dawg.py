@@ -75,3 +75,69 @@ class TestBytesDAWG:
         assert d.prefixes("foobarz") == ["foo", "foobar"]
         assert d.prefixes("x") == []
         assert d.prefixes("bar") == ["bar"]
+
+    def test_prefix_items(self):
+        d = self.dawg()
+        assert d.prefix_items("foobarz") == [
+            ("foo", [b"data1", b"data3"]),
+            ("foobar", [b"data4"]),
+        ]
+        assert d.prefix_items("x") == []
+        assert d.longest_prefix_item("foobarz") == ("foobar", [b"data4"])
+        assert d.longest_prefix_item("foob") == ("foo", [b"data1", b"data3"])
+        assert d.longest_prefix_item("x") is None
+
+    def test_get_first(self):
+        d = self.dawg()
+        assert d.get_first("foo") == b"data1"
+        assert d.get_first(b"foobar") == b"data4"
+        assert d.get_first("fo") is None
+        assert d.get_first("x", default=b"") == b""
+
+    def test_iter_values(self):
+        d = self.dawg()
+        values = d.iter_values("foo")
+        assert next(values) == b"data1"
+        assert list(values) == [b"data3"]
+        assert list(d.iter_values("fo")) == []
+
+    def test_contains_many(self):
+        d = self.dawg()
+        keys = ["foobar", "x", "foo", "fo", "bar", "f", b"foo"]
+        assert d.contains_many(keys) == [key in d for key in keys]
+
+    def test_get_many(self):
+        d = self.dawg()
+        keys = ["foobar", "x", "foo", "bar", "foob", "foo"]
+        assert d.get_many(keys) == [d.get(key) for key in keys]
+        assert d.get_many(["x"], default=[]) == [[]]
+        assert d.b_get_many([b"bar", b"ba"]) == [[b"data2"], []]
+
+    def test_iteritems_start_after(self):
+        d = self.dawg()
+        assert list(d.iteritems(start_after="foo")) == [("foobar", b"data4")]
+        assert list(d.iteritems(start_after=("foo", b"data1"))) == [
+            ("foo", b"data3"),
+            ("foobar", b"data4"),
+        ]
+        assert list(d.iterkeys("fo", start_after="bar")) == ["foo", "foo", "foobar"]
+
+    def test_cursor(self):
+        d = self.dawg()
+        items = d.items()
+        for pos, item in enumerate(items):
+            assert list(d.iteritems(cursor=d.cursor(item))) == items[pos + 1 :]
+
+    def test_items_range(self):
+        d = self.dawg()
+        assert d.items_range("bar", "foobar") == [
+            ("bar", b"data2"),
+            ("foo", b"data1"),
+            ("foo", b"data3"),
+        ]
+        assert d.items_range("c", reverse=True) == [
+            ("foobar", b"data4"),
+            ("foo", b"data3"),
+            ("foo", b"data1"),
+        ]
+        assert d.keys_range(hi="foo", reverse=True) == ["bar"]
@@ -1,3 +1,4 @@
+import itertools
 import os
 
 import pytest
@@ -57,3 +58,62 @@ class TestCompletionDAWG:
         d = CompletionDAWG()
         with pytest.raises(AssertionError):
             d.keys()
+
+    @pytest.mark.parametrize(
+        ("start_after", "expected"),
+        [
+            ("bar", ["f", "foo", "foobar"]),
+            ("f", ["foo", "foobar"]),
+            ("fo", ["foo", "foobar"]),
+            ("foobar", []),
+            ("a", ["bar", "f", "foo", "foobar"]),
+            ("fz", []),
+        ],
+    )
+    def test_iterkeys_start_after(self, start_after, expected):
+        d = self.dawg()
+        assert list(d.iterkeys(start_after=start_after)) == expected
+
+    def test_iterkeys_start_after_prefix(self):
+        d = self.dawg()
+        assert list(d.iterkeys("foo", start_after="foo")) == ["foobar"]
+        assert list(d.iterkeys("foo", start_after="bar")) == ["foo", "foobar"]
+        assert list(d.iterkeys("foo", start_after="g")) == []
+
+    def test_paginate_with_cursor(self):
+        d = CompletionDAWG().load(os.path.join(FIXTURES_DIR, "completion-large.dawg"))
+        expected = d.keys("co")
+        pages = []
+        cursor = None
+        while True:
+            page = list(itertools.islice(d.iterkeys("co", cursor=cursor), 50))
+            if not page:
+                break
+            pages.extend(page)
+            cursor = d.cursor(page[-1])
+        assert pages == expected
+
+    @pytest.mark.parametrize(
+        ("lo", "hi", "expected"),
+        [
+            (None, None, ["bar", "f", "foo", "foobar"]),
+            ("f", None, ["f", "foo", "foobar"]),
+            (None, "foo", ["bar", "f"]),
+            ("bar", "foobar", ["bar", "f", "foo"]),
+            ("ba", "fo", ["bar", "f"]),
+            ("fz", None, []),
+            ("foo", "f", []),
+        ],
+    )
+    def test_keys_range(self, lo, hi, expected):
+        d = self.dawg()
+        assert d.keys_range(lo, hi) == expected
+        assert d.keys_range(lo, hi, reverse=True) == expected[::-1]
+
+    def test_keys_range_large(self):
+        d = CompletionDAWG().load(os.path.join(FIXTURES_DIR, "completion-large.dawg"))
+        keys = d.keys("c")
+        for lo, hi in [("ca", "cb"), ("co", "cor"), ("cz", "d"), ("c", "ca")]:
+            expected = [key for key in keys if lo <= key < hi]
+            assert d.keys_range(lo, hi) == expected
+            assert d.keys_range(lo, hi, reverse=True) == expected[::-1]
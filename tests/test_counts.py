@@ -0,0 +1,173 @@
+import collections
+import gc
+import os
+import random
+import struct
+import warnings
+
+import pytest
+
+from circuit_dawg import BytesDAWG, CompletionDAWG, IntCompletionDAWG
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+class TestCounts:
+    def dawg(self, name="completion.dawg", cls=CompletionDAWG, backend="file"):
+        return cls().load(os.path.join(FIXTURES_DIR, name), backend=backend)
+
+    @pytest.mark.parametrize("prefix", ["", "f", "fo", "foo", "foob", "b", "x"])
+    def test_count(self, prefix):
+        d = self.dawg()
+        expected = len(d.keys(prefix))
+        assert d.count(prefix) == expected
+        d.build_counts()
+        assert d.count(prefix) == expected
+
+    def test_count_large(self):
+        d = self.dawg("completion-large.dawg", backend="array")
+        d.build_counts()
+        for prefix in ["", "a", "co", "re", "zz"]:
+            assert d.count(prefix) == len(d.keys(prefix))
+
+    def test_count_bytes_dawg(self):
+        d = self.dawg("bytes.dawg", BytesDAWG)
+        d.build_counts()
+        assert d.count("foo") == 3
+        assert d.count("bar") == 1
+
+    def test_count_empty_dawg(self):
+        d = self.dawg("completion-empty.dawg")
+        d.build_counts()
+        assert d.count("") == 0
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / "completion.counts")
+        self.dawg().build_counts().save(path)
+        for backend in ["file", "mmap", "array"]:
+            with self.dawg().load_counts(path, backend=backend) as d:
+                assert d.count("fo") == 2
+                assert d.count("") == 4
+
+    @pytest.mark.parametrize("backend", ["file", "mmap", "array", "pread"])
+    def test_load_truncated_counts(self, tmp_path, backend):
+        path = str(tmp_path / "empty.counts")
+        open(path, "wb").close()
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            with self.dawg() as d, pytest.raises((ValueError, struct.error)):
+                d.load_counts(path, backend=backend)
+            gc.collect()
+        assert [w for w in caught if issubclass(w.category, ResourceWarning)] == []
+
+    def test_load_mismatched_counts(self, tmp_path):
+        path = str(tmp_path / "completion.counts")
+        self.dawg("completion-large.dawg", backend="array").build_counts().save(path)
+        with pytest.raises(ValueError):
+            self.dawg().load_counts(path)
+
+    def test_load_counts_of_same_sized_dawg(self, tmp_path):
+        path = str(tmp_path / "shared-prefixes.counts")
+        other = self.dawg("shared-prefixes.dawg")
+        assert other.dct.fp.base_size == self.dawg().dct.fp.base_size
+        other.build_counts().save(path)
+        with pytest.raises(ValueError):
+            self.dawg().load_counts(path)
+
+    @pytest.mark.parametrize(
+        ("prefix", "expected"),
+        [
+            ("", {"count": 3, "min": 1, "max": 5, "sum": 9}),
+            ("f", {"count": 2, "min": 1, "max": 3, "sum": 4}),
+            ("foob", {"count": 1, "min": 3, "max": 3, "sum": 3}),
+            ("x", {"count": 0, "min": None, "max": None, "sum": 0}),
+        ],
+    )
+    def test_aggregate(self, prefix, expected):
+        d = self.dawg("int-completion.dawg", IntCompletionDAWG)
+        assert d.aggregate(prefix) == expected
+        d.build_counts()
+        assert d.counts.has_aggregates()
+        assert d.aggregate(prefix) == expected
+
+    def test_index_and_key_at(self):
+        d = self.dawg()
+        d.build_counts()
+        for rank, key in enumerate(d.keys()):
+            assert d.index(key) == rank
+            assert d.key_at(rank) == key
+
+    def test_index_and_key_at_large(self):
+        d = self.dawg("completion-large.dawg", backend="array")
+        d.build_counts()
+        keys = d.keys()
+        for rank in range(0, len(keys), 997):
+            assert d.index(keys[rank]) == rank
+            assert d.key_at(rank) == keys[rank]
+
+    @pytest.mark.parametrize("key", ["", "fo", "foob", "x", "foobarz"])
+    def test_index_missing(self, key):
+        d = self.dawg()
+        d.build_counts()
+        with pytest.raises(KeyError):
+            d.index(key)
+
+    @pytest.mark.parametrize("rank", [-1, 4, 100])
+    def test_key_at_out_of_range(self, rank):
+        d = self.dawg()
+        d.build_counts()
+        with pytest.raises(IndexError):
+            d.key_at(rank)
+
+    def test_index_bytes_dawg(self):
+        d = self.dawg("bytes.dawg", BytesDAWG)
+        d.build_counts()
+        assert [d.index(key) for key in ["bar", "foo", "foobar"]] == [0, 1, 3]
+        assert [d.key_at(rank) for rank in range(4)] == ["bar", "foo", "foo", "foobar"]
+        with pytest.raises(KeyError):
+            d.index("fo")
+
+    @pytest.mark.parametrize("with_counts", [False, True])
+    def test_sample(self, with_counts):
+        d = self.dawg()
+        if with_counts:
+            d.build_counts()
+        rng = random.Random(0)
+        seen = collections.Counter()
+        for _ in range(600):
+            sample = d.sample(2, rng=rng)
+            assert len(set(sample)) == 2
+            seen.update(sample)
+        assert set(seen) == {"bar", "f", "foo", "foobar"}
+        assert min(seen.values()) > 200
+        assert sorted(d.sample(2, "fo", rng=rng)) == ["foo", "foobar"]
+        assert d.sample(0, "x") == []
+        with pytest.raises(ValueError):
+            d.sample(3, "fo")
+
+    @pytest.mark.parametrize("with_counts", [False, True])
+    def test_sample_randrange_only(self, with_counts):
+        class RandRange:
+            def __init__(self, seed):
+                self.randrange = random.Random(seed).randrange
+
+        d = self.dawg()
+        if with_counts:
+            d.build_counts()
+        rng = RandRange(0)
+        seen = collections.Counter(tuple(d.sample(2, rng=rng)) for _ in range(1200))
+        assert len(seen) == 12  # every ordered pair of the 4 keys
+        assert min(seen.values()) > 50
+
+    def test_sample_bytes_dawg(self):
+        d = self.dawg("bytes.dawg", BytesDAWG)
+        d.build_counts()
+        assert sorted(d.sample(4, rng=random.Random(0))) == ["bar", "foo", "foo", "foobar"]
+
+    def test_sample_large(self):
+        d = self.dawg("completion-large.dawg", backend="array")
+        d.build_counts()
+        sample = d.sample(50, "co", rng=random.Random(1))
+        assert len(set(sample)) == 50
+        assert all(key.startswith("co") for key in sample)
+        assert all(key in d for key in sample)
@@ -12,6 +12,39 @@ class TestDAWG:
         d = DAWG().load(os.path.join(FIXTURES_DIR, "dawg.dawg"))
         assert d.dct.fp.skip != 0
 
-    def test_bad_replaces(self):
+    @pytest.mark.parametrize("replaces", [{"": "x"}, {"a": 1}, {b"a": "b"}, {"a": ["b", None]}])
+    def test_bad_replaces(self, replaces):
         with pytest.raises(ValueError):
-            DAWG.compile_replaces({"air": "bear", "bear": "air"})
+            DAWG.compile_replaces(replaces)
+
+    @pytest.mark.parametrize(
+        ("key", "replaces", "expected"),
+        [
+            ("phoo", {"ph": "f"}, ["foo"]),
+            ("bazbar", {"baz": "foo"}, ["foobar"]),
+            ("fu", {"u": "oo"}, ["foo"]),
+            ("fooxyz", {"xyz": "bar", "x": "b"}, ["foobar"]),
+            ("qoo", {"q": ["b", "f"]}, ["foo"]),
+            ("foo", {"o": ""}, ["foo", "f"]),
+            ("bar", {"air": "bear", "bear": "air"}, ["bar"]),
+            ("foo", {"o": "o"}, ["foo"]),
+            ("foo", {"o": ["o", ""]}, ["foo", "f"]),
+            ("foo", {"oo": "o", "o": ""}, ["foo", "f"]),
+            ("fo", {"o": ["o", "oo"], "oo": "o"}, ["foo"]),
+        ],
+    )
+    def test_similar_keys_multichar(self, key, replaces, expected):
+        d = DAWG().load(os.path.join(FIXTURES_DIR, "dawg.dawg"))
+        assert d.similar_keys(key, DAWG.compile_replaces(replaces)) == expected
+
+    def test_iter_similar_keys_limit(self):
+        d = DAWG().load(os.path.join(FIXTURES_DIR, "dawg.dawg"))
+        replaces = DAWG.compile_replaces({"o": ""})
+        assert list(d.iter_similar_keys("foo", replaces, limit=1)) == ["foo"]
+        assert list(d.iter_similar_keys("foo", replaces, limit=0)) == []
+
+    def test_contains_many(self):
+        d = DAWG().load(os.path.join(FIXTURES_DIR, "dawg.dawg"))
+        keys = ["foobar", "x", "f", b"foo", "fo", "bar", "barz", "foob"]
+        assert d.contains_many(keys) == [key in d for key in keys]
+        assert d.contains_many([]) == []
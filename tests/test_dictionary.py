@@ -50,3 +50,16 @@ class TestDictionary:
         fp = dictionary.fp.fp
         dictionary.close()
         assert fp.closed
+
+    def test_follow_many(self, dictionary):
+        """Test that batch walks reach the same indexes as single walks"""
+        keys = sorted(word.encode("utf8") for word in self.words[:3000])
+        keys += [b"xylophone", b"xylophones", b"zz", b"zzz"]
+        expected = [dictionary.follow_bytes(key, dictionary.ROOT) for key in keys]
+        assert list(dictionary.follow_many(keys)) == expected
+
+    def test_follow_many_unsorted(self, dictionary):
+        """Test that batch walks are correct for unsorted input too"""
+        keys = [b"ABC", b"xyz", b"AB", b"xy", b"A", b""]
+        expected = [dictionary.follow_bytes(key, dictionary.ROOT) for key in keys]
+        assert list(dictionary.follow_many(keys)) == expected
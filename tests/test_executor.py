@@ -0,0 +1,77 @@
+import gc
+import itertools
+import os
+import warnings
+
+import pytest
+
+from circuit_dawg import DAWG, CompletionDAWG, IntDAWG, RecordDAWG
+from circuit_dawg.executor import QueryExecutor
+
+from .utils import words100k
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@pytest.mark.parametrize("kind", ["thread", "process"])
+class TestQueryExecutor:
+    words = words100k()[:3000]
+
+    def test_get(self, kind):
+        path = os.path.join(FIXTURES_DIR, "int.dawg")
+        keys = self.words + ["xylophone"]
+        with QueryExecutor(IntDAWG, path, kind=kind, max_workers=2, chunk_size=128) as ex:
+            assert list(ex.get(keys, -1)) == [len(w) for w in self.words] + [-1]
+
+    def test_contains(self, kind):
+        path = os.path.join(FIXTURES_DIR, "dawg.dawg")
+        keys = ["f", "fo", "foo", "bar", "x"] * 50
+        with QueryExecutor(DAWG, path, kind=kind, max_workers=2, chunk_size=7) as ex:
+            assert list(ex.contains(keys)) == [True, False, True, True, False] * 50
+
+    def test_keys(self, kind):
+        path = os.path.join(FIXTURES_DIR, "completion-large.dawg")
+        prefixes = ["ab", "co", "zz", "re"]
+        with CompletionDAWG().load(path) as d:
+            expected = [d.keys(prefix) for prefix in prefixes]
+        with QueryExecutor(CompletionDAWG, path, kind=kind, chunk_size=1) as ex:
+            assert list(ex.keys(prefixes)) == expected
+
+    def test_similar_keys(self, kind):
+        path = os.path.join(FIXTURES_DIR, "prediction-record.dawg")
+        replaces = DAWG.compile_replaces({"Е": "Ё"})
+        with QueryExecutor(RecordDAWG, path, dawg_args=("=H",), kind=kind) as ex:
+            assert list(ex.similar_keys(["ЕЖ", "УЖ"], replaces)) == [["ЁЖ"], []]
+
+
+class TestBackpressure:
+    def test_bounded_in_flight(self):
+        consumed = 0
+
+        def queries():
+            nonlocal consumed
+            for key in itertools.cycle(["foo", "bar", "x"]):
+                consumed += 1
+                yield key
+
+        path = os.path.join(FIXTURES_DIR, "dawg.dawg")
+        with QueryExecutor(DAWG, path, max_workers=2, chunk_size=10, max_pending=3) as ex:
+            results = list(itertools.islice(ex.contains(queries()), 25))
+        assert results == [True, True, False] * 8 + [True]
+        assert consumed <= 10 * (3 + 3)
+
+    def test_bad_kind(self):
+        with pytest.raises(ValueError):
+            QueryExecutor(DAWG, os.path.join(FIXTURES_DIR, "dawg.dawg"), kind="fiber")
+
+
+class TestClose:
+    @pytest.mark.parametrize("backend", ["file", "mmap", "pread"])
+    def test_closes_readers(self, backend):
+        path = os.path.join(FIXTURES_DIR, "dawg.dawg")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            with QueryExecutor(DAWG, path, backend=backend, max_workers=4, chunk_size=1) as ex:
+                assert list(ex.contains(["foo", "x"] * 20)) == [True, False] * 20
+            gc.collect()
+        assert [w for w in caught if issubclass(w.category, ResourceWarning)] == []
@@ -1,6 +1,7 @@
+import struct
 import pytest
 import io
-from circuit_dawg.wrapper import FilePointer
+from circuit_dawg.wrapper import BufferPointer, FilePointer
 import gc
 
 
@@ -39,3 +40,70 @@ class TestFilePointer:
         file = fp.fp
         fp.close()
         assert file.closed is True
+
+
+class TestBufferPointer:
+    @pytest.fixture(autouse=True, scope="function", name="fp")
+    def setup(self):
+        return BufferPointer(b"\x00\x01\x00\x00Hello World!")
+
+    def test_seek_and_read(self, fp):
+        fp.seek(0)
+        assert fp.read(5) == b"Hello"
+        fp.seek(6)
+        assert fp.read(5) == b"World"
+
+    def test_base_size(self, fp):
+        assert fp.base_size == 256
+        assert fp.skip == 4
+
+    def test_unit_and_byte(self, fp):
+        assert fp.unit(0) == struct.unpack("=I", b"Hell")[0]
+        assert fp.byte(6) == ord("W")
+
+
+class TestPageCache:
+    DATA = b"\x08\x00\x00\x00" + bytes(range(32))
+
+    def pointer(self, cache_blocks=2, block_size=8):
+        return FilePointer(
+            io.BytesIO(self.DATA), cache_blocks=cache_blocks, block_size=block_size
+        )
+
+    def test_reads_match_uncached(self):
+        cached = self.pointer()
+        plain = FilePointer(io.BytesIO(self.DATA))
+        for index in range(8):
+            assert cached.unit(index) == plain.unit(index)
+        for pos in range(32):
+            assert cached.byte(pos) == plain.byte(pos)
+
+    def test_hits_and_misses(self):
+        fp = self.pointer()
+        fp.byte(0)
+        fp.byte(1)
+        fp.byte(2)
+        assert fp.cache_info() == {"hits": 2, "misses": 1, "evictions": 0, "blocks": 1}
+
+    def test_lru_eviction(self):
+        fp = self.pointer()
+        fp.byte(0)  # block 0
+        fp.byte(8)  # block 1
+        fp.byte(1)  # block 0 becomes most recently used
+        fp.byte(16)  # block 2 evicts block 1
+        assert fp.evictions == 1
+        fp.byte(2)
+        assert fp.misses == 3
+        fp.byte(9)
+        assert fp.misses == 4
+
+    def test_straddling_unit(self):
+        fp = FilePointer(io.BytesIO(self.DATA), cache_blocks=4, block_size=10)
+        # unit 1 lives at file offset 8..12, across blocks 0 and 1
+        assert fp.unit(1) == struct.unpack("=I", bytes(range(4, 8)))[0]
+        assert fp.misses == 2
+
+    def test_uncached_info(self):
+        fp = FilePointer(io.BytesIO(self.DATA))
+        fp.unit(0)
+        assert fp.cache_info()["blocks"] == 0
@@ -0,0 +1,84 @@
+import io
+import os
+import random
+
+import pytest
+
+from circuit_dawg import DAWG, BytesDAWG, CompletionDAWG, IntCompletionDAWG, RecordDAWG
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+class TestFindAll:
+    def test_find_all(self):
+        d = DAWG().load(os.path.join(FIXTURES_DIR, "dawg.dawg"))
+        assert d.find_all("a foobar") == [
+            (2, 3, "f"),
+            (2, 5, "foo"),
+            (2, 8, "foobar"),
+            (5, 8, "bar"),
+        ]
+        assert d.find_all("") == []
+        assert d.find_all("xyz") == []
+
+    def test_find_all_values(self):
+        d = IntCompletionDAWG().load(os.path.join(FIXTURES_DIR, "int-completion.dawg"))
+        assert d.find_all("xfoobar foo") == [
+            (1, 4, "foo", 1),
+            (1, 7, "foobar", 3),
+            (4, 7, "bar", 5),
+            (8, 11, "foo", 1),
+        ]
+        d = BytesDAWG().load(os.path.join(FIXTURES_DIR, "bytes.dawg"))
+        assert d.find_all("barfoo") == [
+            (0, 3, "bar", [b"data2"]),
+            (3, 6, "foo", [b"data1", b"data3"]),
+        ]
+
+    def test_find_all_bytes(self):
+        d = RecordDAWG("=H").load(os.path.join(FIXTURES_DIR, "prediction-record.dawg"))
+        text = "ЁЖИК ЕМ"
+        assert d.find_all(text) == [
+            (0, 2, "ЁЖ", [(2,)]),
+            (0, 4, "ЁЖИК", [(4,)]),
+            (5, 7, "ЕМ", [(2,)]),
+        ]
+        assert d.find_all(text.encode("utf8")) == [
+            (0, 4, "ЁЖ", [(2,)]),
+            (0, 8, "ЁЖИК", [(4,)]),
+            (9, 13, "ЕМ", [(2,)]),
+        ]
+
+    @pytest.mark.parametrize("size", [1, 3, 7])
+    def test_iter_find_all_chunks(self, size):
+        d = RecordDAWG("=H").load(os.path.join(FIXTURES_DIR, "prediction-record.dawg"))
+        text = "ОЗЕРО ЁЖИКЕ ДЕРЁВНЯ ЕМ"
+        data = text.encode("utf8")
+        text_chunks = (text[pos : pos + size] for pos in range(0, len(text), size))
+        byte_chunks = (data[pos : pos + size] for pos in range(0, len(data), size))
+        assert list(d.iter_find_all(text_chunks)) == d.find_all(text)
+        assert list(d.iter_find_all(byte_chunks)) == d.find_all(data)
+
+    def test_iter_find_all_file(self):
+        d = DAWG().load(os.path.join(FIXTURES_DIR, "dawg.dawg"))
+        stream = io.StringIO("foo\nbar\nfoo")
+        assert list(d.iter_find_all(stream)) == [
+            (0, 1, "f"),
+            (0, 3, "foo"),
+            (4, 7, "bar"),
+            (8, 9, "f"),
+            (8, 11, "foo"),
+        ]
+
+    def test_find_all_large(self):
+        d = CompletionDAWG().load(
+            os.path.join(FIXTURES_DIR, "completion-large.dawg"), backend="array"
+        )
+        rng = random.Random(0)
+        text = " ".join(rng.sample(d.keys("b"), 200))
+        expected = [
+            (start, start + len(key), key)
+            for start in range(len(text))
+            for key in d.prefixes(text[start:])
+        ]
+        assert d.find_all(text) == expected
@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from circuit_dawg import BytesDAWG, CompletionDAWG, IntCompletionDAWG, RecordDAWG
+
+from .utils import shallow_stack
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def levenshtein(a, b):
+    row = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        next_row = [i]
+        for j, char_b in enumerate(b, 1):
+            next_row.append(min(next_row[j - 1] + 1, row[j] + 1, row[j - 1] + (char_a != char_b)))
+        row = next_row
+    return row[-1]
+
+
+class TestFuzzy:
+    @pytest.mark.parametrize(
+        ("word", "max_distance", "expected"),
+        [
+            ("foo", 0, ["foo"]),
+            ("fo", 1, ["f", "foo"]),
+            ("fob", 1, ["foo"]),
+            ("fooba", 1, ["foobar"]),
+            ("baz", 1, ["bar"]),
+            ("", 1, ["f"]),
+            ("xyz", 2, []),
+        ],
+    )
+    def test_fuzzy_keys(self, word, max_distance, expected):
+        d = CompletionDAWG().load(os.path.join(FIXTURES_DIR, "completion.dawg"))
+        assert d.fuzzy_keys(word, max_distance) == expected
+
+    @pytest.mark.parametrize("word", ["hello", "compter", "a", "recieve"])
+    def test_fuzzy_keys_large(self, word):
+        d = CompletionDAWG().load(
+            os.path.join(FIXTURES_DIR, "completion-large.dawg"), backend="array"
+        )
+        keys = d.keys(word[0])
+        expected = [key for key in keys if levenshtein(word, key) <= 2]
+        assert [key for key in d.fuzzy_keys(word, 2) if key[0] == word[0]] == expected
+
+    def test_fuzzy_keys_unicode(self):
+        d = RecordDAWG("=H").load(os.path.join(FIXTURES_DIR, "prediction-record.dawg"))
+        assert d.fuzzy_keys("ЕЖИК", 1) == ["ЁЖИК"]
+        assert d.fuzzy_keys("ОЗЕРА", 1) == ["ОЗЁРА", "ОЗЕРА", "ОЗЕРО"]
+
+    def test_fuzzy_items_bytes_dawg(self):
+        d = BytesDAWG().load(os.path.join(FIXTURES_DIR, "bytes.dawg"))
+        assert d.fuzzy_keys("fo") == ["foo"]
+        assert d.fuzzy_items("fo") == [("foo", [b"data1", b"data3"])]
+        assert d.fuzzy_items("fooba") == [("foobar", [b"data4"])]
+
+    def test_fuzzy_items_record_dawg(self):
+        d = RecordDAWG(">3H").load(os.path.join(FIXTURES_DIR, "record.dawg"))
+        assert d.fuzzy_items("boo") == [("foo", [(3, 2, 1), (3, 2, 256)])]
+
+    def test_fuzzy_items_int_dawg(self):
+        d = IntCompletionDAWG().load(os.path.join(FIXTURES_DIR, "int-completion.dawg"))
+        assert d.fuzzy_items("fao") == [("foo", 1)]
+        assert d.fuzzy_items("bars", 2) == [("bar", 5)]
+
+    def test_fuzzy_empty_dawg(self):
+        d = CompletionDAWG().load(os.path.join(FIXTURES_DIR, "completion-empty.dawg"))
+        assert d.fuzzy_keys("foo", 3) == []
+
+    def test_fuzzy_long_keys(self):
+        d = CompletionDAWG().load(os.path.join(FIXTURES_DIR, "long-keys.dawg"))
+        key = max(d.keys(), key=len)
+        with shallow_stack():
+            assert d.fuzzy_keys(key, 0) == [key]
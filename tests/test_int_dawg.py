@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from circuit_dawg import IntCompletionDAWG, IntDAWG
+
+from .utils import words100k
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+class TestIntDAWG:
+    words = words100k()
+
+    def dawg(self):
+        return IntDAWG().load(os.path.join(FIXTURES_DIR, "int.dawg"))
+
+    def test_getitem(self):
+        d = self.dawg()
+        assert d["ABC"] == 3
+
+    def test_getitem_missing(self):
+        d = self.dawg()
+        with pytest.raises(KeyError):
+            d["xylophone"]
+
+    def test_get_many(self):
+        d = self.dawg()
+        keys = self.words[:2000] + ["xylophone", "ABCx", ""]
+        assert d.get_many(keys) == [d.get(key) for key in keys]
+        assert d.get_many(["xylophone"], default=0) == [0]
+
+    def test_contains_many(self):
+        d = self.dawg()
+        keys = ["ABC", "xylophone", "AB", "ABC"]
+        assert d.contains_many(keys) == [key in d for key in keys]
+
+    def test_b_get_many(self):
+        d = self.dawg()
+        assert d.b_get_many([b"ABC", b"xylophone"]) == [3, -1]
+
+    def test_prefix_items(self):
+        d = self.dawg()
+        assert d.prefix_items("ABCD") == [(key, d[key]) for key in d.prefixes("ABCD")]
+        assert d.longest_prefix_item("ABCD") == ("ABC", 3)
+        assert d.longest_prefix_item("xylophone") is None
+        assert d.longest_prefix_item("xylophone", default=()) == ()
+
+
+class TestIntCompletionDAWG:
+    def dawg(self):
+        return IntCompletionDAWG().load(os.path.join(FIXTURES_DIR, "int-completion.dawg"))
+
+    def test_get_many(self):
+        d = self.dawg()
+        assert d.get_many(["foobar", "foo", "fo", "bar"]) == [3, 1, None, 5]
+
+    def test_iteritems_start_after(self):
+        d = self.dawg()
+        assert list(d.iteritems(start_after="foo")) == [("foobar", 3)]
+        assert list(d.iteritems(cursor=d.cursor("bar"))) == [("foo", 1), ("foobar", 3)]
+
+    def test_items_range(self):
+        d = self.dawg()
+        assert d.items_range("bar", "foobar") == [("bar", 5), ("foo", 1)]
+        assert d.items_range("f", reverse=True) == [("foobar", 3), ("foo", 1)]
+
+    def test_prefix_items(self):
+        d = self.dawg()
+        assert d.prefix_items("foobarz") == [("foo", 1), ("foobar", 3)]
+        assert d.prefix_items("x") == []
+        assert d.longest_prefix_item("foob") == ("foo", 1)
@@ -0,0 +1,117 @@
+import fnmatch
+import os
+import re
+
+import pytest
+
+from circuit_dawg import BytesDAWG, CompletionDAWG, IntCompletionDAWG, RecordDAWG
+
+from .utils import shallow_stack
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+class TestMatch:
+    def dawg(self):
+        return CompletionDAWG().load(os.path.join(FIXTURES_DIR, "completion.dawg"))
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ("foo", ["foo"]),
+            ("fo", []),
+            ("f*", ["f", "foo", "foobar"]),
+            ("f?o", ["foo"]),
+            ("*ar", ["bar", "foobar"]),
+            ("*", ["bar", "f", "foo", "foobar"]),
+            ("?", ["f"]),
+            ("[bf]*r", ["bar", "foobar"]),
+            ("[a-c]??", ["bar"]),
+            ("[!b]*", ["f", "foo", "foobar"]),
+            ("f[", []),
+        ],
+    )
+    def test_match(self, pattern, expected):
+        assert self.dawg().match(pattern) == expected
+
+    def test_match_length(self):
+        d = self.dawg()
+        assert d.match("*", min_length=3) == ["bar", "foo", "foobar"]
+        assert d.match("*", max_length=3) == ["bar", "f", "foo"]
+        assert d.match("f*", min_length=2, max_length=3) == ["foo"]
+
+    @pytest.mark.parametrize("pattern", ["c?t*", "h*o", "[abc]a?", "a[]b]*", "[!a-y]??"])
+    def test_match_large(self, pattern):
+        d = CompletionDAWG().load(
+            os.path.join(FIXTURES_DIR, "completion-large.dawg"), backend="array"
+        )
+        regex = re.compile(fnmatch.translate(pattern))
+        keys = d.keys(pattern[0]) if pattern[0].isalpha() else d.keys()
+        assert d.match(pattern) == [key for key in keys if regex.match(key)]
+
+    def test_match_unicode(self):
+        d = RecordDAWG("=H").load(os.path.join(FIXTURES_DIR, "prediction-record.dawg"))
+        assert d.match("ОЗ?РА") == ["ОЗЁРА", "ОЗЕРА"]
+        assert d.match("[ЁЕ]*", max_length=2) == ["ЁЖ", "ЕМ"]
+
+    def test_match_bytes_dawg(self):
+        d = BytesDAWG().load(os.path.join(FIXTURES_DIR, "bytes.dawg"))
+        assert d.match("f*") == ["foo", "foobar"]
+        assert d.match("*o") == ["foo"]
+
+    def test_match_long_keys(self):
+        d = CompletionDAWG().load(os.path.join(FIXTURES_DIR, "long-keys.dawg"))
+        keys = d.keys()
+        with shallow_stack():
+            assert d.match("*") == keys
+            assert d.regex_keys(".*") == keys
+
+
+class TestRegex:
+    def dawg(self):
+        return CompletionDAWG().load(os.path.join(FIXTURES_DIR, "completion.dawg"))
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ("foo", ["foo"]),
+            ("fo", []),
+            ("f.*", ["f", "foo", "foobar"]),
+            ("fo+(bar)?", ["foo", "foobar"]),
+            ("(bar|f)", ["bar", "f"]),
+            ("[a-c].r", ["bar"]),
+            ("[^b].{2}", ["foo"]),
+            (".{1,3}", ["bar", "f", "foo"]),
+            ("^.*ar$", ["bar", "foobar"]),
+            (r"\w+", ["bar", "f", "foo", "foobar"]),
+            (r"f\.o", []),
+            (r"ba[r$]\$?", ["bar"]),
+        ],
+    )
+    def test_regex_keys(self, pattern, expected):
+        assert self.dawg().regex_keys(pattern) == expected
+
+    @pytest.mark.parametrize("pattern", ["(a", "a)", "*a", "[ab", r"\b", "a{3,1}", "a^b", "f$|bar", "^^f", "a$$"])
+    def test_bad_regex(self, pattern):
+        with pytest.raises(ValueError):
+            self.dawg().regex_keys(pattern)
+
+    @pytest.mark.parametrize("pattern", ["c.t.*", "(un|re).*able", "[a-z]{3}", "b.*(ed|ly)"])
+    def test_regex_keys_large(self, pattern):
+        d = CompletionDAWG().load(
+            os.path.join(FIXTURES_DIR, "completion-large.dawg"), backend="array"
+        )
+        regex = re.compile(pattern)
+        keys = d.keys(pattern[0]) if pattern[0].isalpha() else d.keys()
+        assert d.regex_keys(pattern) == [key for key in keys if regex.fullmatch(key)]
+
+    def test_regex_unicode(self):
+        d = RecordDAWG("=H").load(os.path.join(FIXTURES_DIR, "prediction-record.dawg"))
+        assert d.regex_keys("ОЗ[ЕЁ]РА") == ["ОЗЁРА", "ОЗЕРА"]
+        assert d.regex_items("Д.*") == [("ДЕРЁВНЯ", [(7,)]), ("ДЕРЕВНЯ", [(7,)])]
+
+    def test_regex_items(self):
+        d = BytesDAWG().load(os.path.join(FIXTURES_DIR, "bytes.dawg"))
+        assert d.regex_items("fo+") == [("foo", [b"data1", b"data3"])]
+        d = IntCompletionDAWG().load(os.path.join(FIXTURES_DIR, "int-completion.dawg"))
+        assert d.regex_items(".*o.*") == [("foo", 1), ("foobar", 3)]
@@ -64,6 +64,64 @@ class TestRecordDAWG:
         assert d.prefixes("x") == []
         assert d.prefixes("bar") == ["bar"]
 
+    def test_prefix_items(self):
+        d = self.dawg()
+        assert d.prefix_items("foobarz") == [
+            ("foo", [(3, 2, 1), (3, 2, 256)]),
+            ("foobar", [(6, 3, 0)]),
+        ]
+        assert d.longest_prefix_item("barz") == ("bar", [(3, 1, 0)])
+        assert d.longest_prefix_item("ba", default=False) is False
+
+    def test_get_first(self):
+        d = self.dawg()
+        assert d.get_first("foo") == (3, 2, 1)
+        assert d.get_first("x") is None
+        assert list(d.iter_values("foo")) == d["foo"]
+
+    def test_items_columnar(self):
+        d = self.dawg()
+        keys, columns = d.items_columnar()
+        items = d.items()
+        assert keys == [key for key, _ in items]
+        assert list(zip(*columns)) == [value for _, value in items]
+        assert columns[0].typecode == "H"
+        keys, columns = d.items_columnar("fooz")
+        assert keys == []
+        assert [list(column) for column in columns] == [[], [], []]
+
+    def test_get_many_columnar(self):
+        d = self.dawg()
+        keys = ["foo", "x", "bar", "foo"]
+        offsets, columns = d.get_many_columnar(keys)
+        assert list(offsets) == [0, 2, 2, 3, 5]
+        rows = list(zip(*columns))
+        assert [rows[offsets[i] : offsets[i + 1]] for i in range(len(keys))] == d.get_many(keys, [])
+
+    def test_get_many(self):
+        d = self.dawg()
+        assert d.get_many(["foobar", "x", "foo"]) == [
+            [(6, 3, 0)],
+            None,
+            [(3, 2, 1), (3, 2, 256)],
+        ]
+
+    def test_iteritems_start_after(self):
+        d = self.dawg()
+        assert list(d.iteritems(start_after=("foo", (3, 2, 1)))) == [
+            ("foo", (3, 2, 256)),
+            ("foobar", (6, 3, 0)),
+        ]
+
+    def test_items_range(self):
+        d = self.dawg()
+        assert d.items_range("c", reverse=True) == [
+            ("foobar", (6, 3, 0)),
+            ("foo", (3, 2, 256)),
+            ("foo", (3, 2, 1)),
+        ]
+        assert d.items_range("bar", "c") == [("bar", (3, 1, 0))]
+
 
 class TestPredictionRecordDAWG:
     REPLACES = DAWG.compile_replaces({"Е": "Ё"})
@@ -117,3 +175,11 @@ class TestPredictionRecordDAWG:
     @pytest.mark.parametrize(("word", "prediction"), SUITE_VALUES)
     def test_record_dawg_items_values(self, word, prediction):
         assert self.dawg().similar_item_values(word, self.REPLACES) == prediction
+
+    def test_iter_similar_limit(self):
+        d = self.dawg()
+        assert list(d.iter_similar_keys("ДЕРЕВНЯ", self.REPLACES, limit=1)) == ["ДЕРЕВНЯ"]
+        assert list(d.iter_similar_items("ОЗЕРА", self.REPLACES, limit=1)) == [
+            ("ОЗЕРА", [(5,)])
+        ]
+        assert list(d.iter_similar_item_values("ЕЖ", self.REPLACES, limit=5)) == [[(2,)]]
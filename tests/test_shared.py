@@ -0,0 +1,126 @@
+import os
+import subprocess
+import sys
+import textwrap
+from concurrent.futures import ProcessPoolExecutor
+
+from circuit_dawg import CompletionDAWG, IntDAWG, RecordDAWG
+from circuit_dawg.shared import publish
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Publishes a DAWG, attaches it in this process, in a worker of every start
+# method and in an unrelated process, then closes it. Before Python 3.13
+# attaching touches the resource tracker, which reports any mistake on
+# stderr when it exits.
+LIFECYCLE_SCRIPT = textwrap.dedent(
+    """
+    import multiprocessing
+    import pickle
+    import subprocess
+    import sys
+
+    from circuit_dawg import CompletionDAWG
+    from circuit_dawg.shared import publish
+
+    ATTACH = (
+        "import pickle, sys\\n"
+        "handle = pickle.loads(sys.stdin.buffer.read())\\n"
+        "d = handle.attach()\\n"
+        "assert d.keys('foo') == ['foo', 'foobar']\\n"
+        "d.close()\\n"
+        "handle.detach()\\n"
+    )
+
+
+    def keys(handle):
+        d = handle.attach()
+        try:
+            return d.keys("foo")
+        finally:
+            d.close()
+            handle.detach()
+
+
+    if __name__ == "__main__":
+        with CompletionDAWG().load(sys.argv[1]) as d:
+            shared = publish(d)
+        with shared:
+            attached = shared.handle.attach()
+            attached.close()
+            for method in multiprocessing.get_all_start_methods():
+                with multiprocessing.get_context(method).Pool(1) as pool:
+                    assert pool.apply(keys, (shared.handle,)) == ["foo", "foobar"]
+            subprocess.run(
+                [sys.executable, "-c", ATTACH], input=pickle.dumps(shared.handle), check=True
+            )
+            # The unrelated process must not have unlinked the block.
+            attached = shared.handle.attach()
+            assert attached.keys("foo") == ["foo", "foobar"]
+            attached.close()
+    """
+)
+
+
+def _worker_keys(handle, prefix):
+    d = handle.attach()
+    try:
+        return d.keys(prefix)
+    finally:
+        d.close()
+        handle.detach()
+
+
+class TestSharedMemory:
+    def test_attach_in_process(self):
+        with CompletionDAWG().load(os.path.join(FIXTURES_DIR, "completion.dawg")) as d:
+            shared = publish(d)
+        with shared:
+            attached = shared.handle.attach()
+            assert attached.keys("foo") == ["foo", "foobar"]
+            assert isinstance(attached, CompletionDAWG)
+            attached.close()
+
+    def test_zero_copy(self):
+        with IntDAWG().load(os.path.join(FIXTURES_DIR, "int.dawg")) as d:
+            shared = publish(d)
+        with shared:
+            first = shared.handle.attach()
+            second = shared.handle.attach()
+            assert first.dct.fp.buf.obj is second.dct.fp.buf.obj
+            assert first["ABC"] == second["ABC"] == 3
+            first.close()
+            second.close()
+
+    def test_record_dawg_args(self):
+        with RecordDAWG(">3H").load(os.path.join(FIXTURES_DIR, "record.dawg")) as d:
+            shared = publish(d)
+        with shared:
+            attached = shared.handle.attach()
+            assert attached["foo"] == [(3, 2, 1), (3, 2, 256)]
+            attached.close()
+
+    def test_worker_processes(self):
+        path = os.path.join(FIXTURES_DIR, "completion-large.dawg")
+        with CompletionDAWG().load(path) as d:
+            expected = [d.keys(prefix) for prefix in ["ab", "co"]]
+            shared = publish(d)
+        with shared, ProcessPoolExecutor(max_workers=2) as pool:
+            results = pool.map(_worker_keys, [shared.handle] * 2, ["ab", "co"])
+            assert list(results) == expected
+
+    def test_resource_tracker_is_quiet(self, tmp_path):
+        script = tmp_path / "lifecycle.py"
+        script.write_text(LIFECYCLE_SCRIPT)
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        result = subprocess.run(
+            [sys.executable, str(script), os.path.join(FIXTURES_DIR, "completion.dawg")],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=False,
+        )
+        assert result.returncode == 0, result.stderr
+        assert "resource_tracker" not in result.stderr
+        assert "Traceback" not in result.stderr
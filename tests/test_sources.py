@@ -0,0 +1,96 @@
+import io
+import os
+import zipfile
+
+import pytest
+
+from circuit_dawg import (
+    DAWG,
+    BytesDAWG,
+    CompletionDAWG,
+    IntCompletionDAWG,
+    IntDAWG,
+    RecordDAWG,
+)
+from circuit_dawg.wrapper import Dictionary
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def fixture_bytes(name):
+    with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+        return f.read()
+
+
+def zip_archive(name, compression):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=compression) as zf:
+        zf.writestr(name, fixture_bytes(name))
+    buf.seek(0)
+    return zipfile.ZipFile(buf)
+
+
+BUFFER_TYPES = [bytes, bytearray, memoryview]
+
+
+class TestFromBytes:
+    @pytest.mark.parametrize("buffer_type", BUFFER_TYPES)
+    def test_dawg(self, buffer_type):
+        d = DAWG().frombytes(buffer_type(fixture_bytes("dawg.dawg")))
+        assert "foo" in d
+        assert "fo" not in d
+
+    @pytest.mark.parametrize("buffer_type", BUFFER_TYPES)
+    def test_completion_dawg(self, buffer_type):
+        d = CompletionDAWG().frombytes(buffer_type(fixture_bytes("completion.dawg")))
+        assert d.keys() == ["bar", "f", "foo", "foobar"]
+
+    def test_bytes_dawg(self):
+        d = BytesDAWG().frombytes(fixture_bytes("bytes.dawg"))
+        assert d["foo"] == [b"data1", b"data3"]
+
+    def test_record_dawg(self):
+        d = RecordDAWG(">3H").frombytes(fixture_bytes("record.dawg"))
+        assert d["bar"] == [(3, 1, 0)]
+
+    def test_int_dawgs(self):
+        assert IntDAWG().frombytes(fixture_bytes("int.dawg"))["ABC"] == 3
+        d = IntCompletionDAWG().frombytes(fixture_bytes("int-completion.dawg"))
+        assert d.items() == [("bar", 5), ("foo", 1), ("foobar", 3)]
+
+    def test_zero_copy(self):
+        data = bytearray(fixture_bytes("dawg.dawg"))
+        d = DAWG().frombytes(data)
+        assert d.dct.fp.buf.obj is data
+
+    def test_close_keeps_buffer(self):
+        data = bytearray(fixture_bytes("completion.dawg"))
+        with CompletionDAWG().frombytes(data) as d:
+            assert "foo" in d
+        data.append(0)  # the buffer is no longer exported
+
+    def test_dictionary(self):
+        dct = Dictionary.frombytes(fixture_bytes("int.dawg"))
+        assert dct.find(b"ABC") == 3
+
+
+class TestRead:
+    def test_bytesio(self):
+        d = CompletionDAWG().read(io.BytesIO(fixture_bytes("completion.dawg")))
+        assert d.keys("foo") == ["foo", "foobar"]
+
+    def test_open_file(self):
+        fp = open(os.path.join(FIXTURES_DIR, "int.dawg"), "rb")
+        with IntDAWG().read(fp, backend="pread") as d:
+            assert d["ABC"] == 3
+        assert fp.closed
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_zip_member(self, compression):
+        zf = zip_archive("bytes.dawg", compression)
+        with BytesDAWG().read(zf.open("bytes.dawg"), backend="array") as d:
+            assert d.items("foob") == [("foobar", b"data4")]
+        with BytesDAWG().read(zf.open("bytes.dawg"), cache_blocks=8) as d:
+            assert d["foo"] == [b"data1", b"data3"]
+        with BytesDAWG().frombytes(zf.read("bytes.dawg")) as d:
+            assert d["bar"] == [b"data2"]
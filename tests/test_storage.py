@@ -0,0 +1,133 @@
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from circuit_dawg import BytesDAWG, CompletionDAWG
+from circuit_dawg.storage import HTTPRangeFile
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Minimal static file server with single-range ``Range`` support."""
+
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self):
+        type(self).connections += 1
+        super().setup()
+
+    def do_GET(self):
+        # /full/<name> ignores Range; /drop/<name> closes the connection
+        # after each response without saying so.
+        prefix = os.path.dirname(self.path)
+        path = os.path.join(FIXTURES_DIR, os.path.basename(self.path))
+        if not os.path.exists(path):
+            self.send_error(404)
+            return
+        with open(path, "rb") as f:
+            data = f.read()
+
+        status = 200
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if match and prefix != "/full":
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else len(data) - 1
+            if start >= len(data):
+                self.send_response(416)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            data = data[start : end + 1]
+            status = 206
+
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        if prefix == "/drop":
+            self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestHTTPRangeFile:
+    def test_read_ranges(self, server):
+        with open(os.path.join(FIXTURES_DIR, "bytes.dawg"), "rb") as f:
+            expected = f.read()
+        with HTTPRangeFile(server + "/bytes.dawg") as fp:
+            fp.seek(10)
+            assert fp.read(16) == expected[10:26]
+            assert fp.tell() == 26
+            fp.seek(len(expected) - 2)
+            assert fp.read(10) == expected[-2:]
+            assert fp.read(4) == b""
+            assert fp.requests == 3
+
+    def test_range_ignored(self, server):
+        with open(os.path.join(FIXTURES_DIR, "bytes.dawg"), "rb") as f:
+            expected = f.read()
+        with HTTPRangeFile(server + "/full/bytes.dawg") as fp:
+            fp.seek(10)
+            assert fp.read(16) == expected[10:26]
+            fp.seek(len(expected) - 2)
+            assert fp.read(10) == expected[-2:]
+            assert fp.read(4) == b""
+            fp.seek(0)
+            assert fp.read() == expected
+            # The whole file came with the first response.
+            assert fp.requests == 1
+
+    def test_retry_counted(self, server):
+        with open(os.path.join(FIXTURES_DIR, "bytes.dawg"), "rb") as f:
+            expected = f.read()
+        with HTTPRangeFile(server + "/drop/bytes.dawg") as fp:
+            assert fp.read(4) == expected[:4]
+            assert fp.read(4) == expected[4:8]
+            # The second read is sent, dropped and sent again.
+            assert fp.requests == 3
+
+    def test_missing_file(self, server):
+        with HTTPRangeFile(server + "/missing.dawg") as fp:
+            with pytest.raises(OSError):
+                fp.read(4)
+
+    def test_bad_scheme(self):
+        with pytest.raises(ValueError):
+            HTTPRangeFile("ftp://example.com/words.dawg")
+
+    def test_bytes_dawg(self, server):
+        with BytesDAWG().read(HTTPRangeFile(server + "/bytes.dawg"), cache_blocks=8) as d:
+            assert d["foo"] == [b"data1", b"data3"]
+            assert d.items("foob") == [("foobar", b"data4")]
+
+    def test_request_counts(self, server):
+        path = os.path.join(FIXTURES_DIR, "completion-large.dawg")
+        with CompletionDAWG().load(path) as reference:
+            expected = reference.keys("ab")
+
+        fp = HTTPRangeFile(server + "/completion-large.dawg")
+        connections = RangeHandler.connections
+        with CompletionDAWG().read(fp, cache_blocks=64, block_size=4096) as d:
+            before = fp.requests
+            assert d.keys("ab") == expected
+            # Hundreds of unit reads are served by a handful of block fetches.
+            assert fp.requests - before < 40
+            assert d.dct.fp.hits + d.guide.fp.hits > 10 * (fp.requests - before)
+        # One keep-alive connection served every request.
+        assert RangeHandler.connections - connections == 1
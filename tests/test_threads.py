@@ -0,0 +1,57 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from circuit_dawg import BytesDAWG, CompletionDAWG, IntDAWG
+
+from .utils import words100k
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+THREAD_SAFE_BACKENDS = ["pread", "mmap", "array"]
+
+
+@pytest.mark.parametrize("backend", THREAD_SAFE_BACKENDS)
+class TestConcurrentReaders:
+    """A single loaded DAWG must answer correctly when shared by a thread pool."""
+
+    words = words100k()[:4000]
+    prefixes = ["a", "b", "co", "de", "in", "pre", "re", "st", "un", "z"]
+
+    def test_concurrent_get(self, backend):
+        with IntDAWG().load(os.path.join(FIXTURES_DIR, "int.dawg"), backend=backend) as d:
+            chunks = [self.words[i::8] for i in range(8)]
+
+            def work(chunk):
+                return [d.get(word) for word in chunk]
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                for chunk, values in zip(chunks, pool.map(work, chunks)):
+                    assert values == [len(word) for word in chunk]
+
+    def test_concurrent_keys(self, backend):
+        path = os.path.join(FIXTURES_DIR, "completion-large.dawg")
+        with CompletionDAWG().load(path) as reference:
+            expected = {prefix: reference.keys(prefix) for prefix in self.prefixes}
+
+        with CompletionDAWG().load(path, backend=backend) as d:
+            tasks = self.prefixes * 3
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                for prefix, keys in zip(tasks, pool.map(d.keys, tasks)):
+                    assert keys == expected[prefix]
+
+    def test_concurrent_mixed(self, backend):
+        with BytesDAWG().load(os.path.join(FIXTURES_DIR, "bytes.dawg"), backend=backend) as d:
+
+            def work(i):
+                if i % 2:
+                    return d.get("foo")
+                return d.keys("fo")
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                for i, result in enumerate(pool.map(work, range(2000))):
+                    if i % 2:
+                        assert result == [b"data1", b"data3"]
+                    else:
+                        assert result == ["foo", "foo", "foobar"]
@@ -0,0 +1,97 @@
+import os
+
+import pytest
+
+from circuit_dawg import DAWG, BytesDAWG, CompletionDAWG, IntCompletionDAWG, RecordDAWG
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+TEXT = "xfoobarbarfoofoobx"
+
+
+class TestTokenize:
+    def dawg(self):
+        return IntCompletionDAWG().load(os.path.join(FIXTURES_DIR, "int-completion.dawg"))
+
+    def test_longest(self):
+        assert list(self.dawg().tokenize(TEXT)) == [
+            (1, 7, "foobar", 3),
+            (7, 10, "bar", 5),
+            (10, 13, "foo", 1),
+            (13, 16, "foo", 1),
+        ]
+
+    def test_all(self):
+        assert list(self.dawg().tokenize(TEXT, "all")) == [
+            (1, 4, "foo", 1),
+            (1, 7, "foobar", 3),
+            (4, 7, "bar", 5),
+            (7, 10, "bar", 5),
+            (10, 13, "foo", 1),
+            (13, 16, "foo", 1),
+        ]
+
+    def test_all_matches_prefixes(self):
+        d = DAWG().load(os.path.join(FIXTURES_DIR, "dawg.dawg"))
+        text = "foobarfoo"
+        expected = [
+            (start, start + len(key), key)
+            for start in range(len(text))
+            for key in d.prefixes(text[start:])
+        ]
+        assert list(d.tokenize(text, "all")) == expected
+
+    @pytest.mark.parametrize(
+        ("name", "cls"), [("int-completion.dawg", IntCompletionDAWG), ("dawg.dawg", DAWG)]
+    )
+    def test_all_is_find_all(self, name, cls):
+        d = cls().load(os.path.join(FIXTURES_DIR, name))
+        assert list(d.tokenize(TEXT, "all")) == d.find_all(TEXT)
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("mathspark", ["math", "spark"]),
+            ("breamsmooch", ["bream", "smooch"]),
+            ("crackshirt", ["crack", "shirt"]),
+        ],
+    )
+    def test_min_tokens(self, text, expected):
+        d = CompletionDAWG().load(
+            os.path.join(FIXTURES_DIR, "completion-large.dawg"), backend="array"
+        )
+        assert [token[2] for token in d.tokenize(text, "min_tokens")] == expected
+        assert [token[2] for token in d.tokenize(text)] != expected
+
+    @pytest.mark.parametrize("strategy", ["longest", "all", "min_tokens"])
+    @pytest.mark.parametrize("size", [1, 2, 5])
+    def test_chunks(self, strategy, size):
+        d = self.dawg()
+        chunks = (TEXT[pos : pos + size] for pos in range(0, len(TEXT), size))
+        assert list(d.tokenize(chunks, strategy)) == list(d.tokenize(TEXT, strategy))
+
+    def test_empty(self):
+        d = self.dawg()
+        for strategy in ["longest", "all", "min_tokens"]:
+            assert list(d.tokenize("", strategy)) == []
+            assert list(d.tokenize(["", ""], strategy)) == []
+            assert list(d.tokenize("xyz", strategy)) == []
+
+    def test_unknown_strategy(self):
+        with pytest.raises(ValueError):
+            self.dawg().tokenize(TEXT, "shortest")
+
+    def test_unicode_offsets(self):
+        d = RecordDAWG("=H").load(os.path.join(FIXTURES_DIR, "prediction-record.dawg"))
+        assert list(d.tokenize(["ЁЖИ", "КЕМ ОЗ", "ЕРО"], "min_tokens")) == [
+            (0, 4, "ЁЖИК", [(4,)]),
+            (4, 6, "ЕМ", [(2,)]),
+            (7, 12, "ОЗЕРО", [(5,)]),
+        ]
+
+    def test_bytes_dawg(self):
+        d = BytesDAWG().load(os.path.join(FIXTURES_DIR, "bytes.dawg"))
+        assert list(d.tokenize("barfoo")) == [
+            (0, 3, "bar", [b"data2"]),
+            (3, 6, "foo", [b"data1", b"data3"]),
+        ]
@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+from circuit_dawg import DAWG, IntDAWG, RecordDAWG
+
+from .utils import words100k
+
+np = pytest.importorskip("numpy")
+
+from circuit_dawg import vectorized  # noqa: E402
+from circuit_dawg.vectorized import VectorLookup  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+class TestVectorLookup:
+    words = words100k()[:5000]
+    missing = ["xylophone", "ABCx", "", "zzz", "мир"]
+
+    @pytest.mark.parametrize("backend", ["file", "mmap", "array"])
+    def test_values(self, backend):
+        with IntDAWG().load(os.path.join(FIXTURES_DIR, "int.dawg"), backend=backend) as d:
+            keys = self.words + self.missing
+            lookup = VectorLookup(d)
+            res = lookup.values(keys)
+            assert res.dtype == np.int64
+            assert res.tolist() == [d.get(key, -1) for key in keys]
+            del lookup
+
+    def test_contains(self):
+        d = DAWG().load(os.path.join(FIXTURES_DIR, "dawg.dawg"))
+        keys = ["f", "fo", "foo", b"foobar", "foobarz", "", "bar", "x"]
+        assert VectorLookup(d).contains(keys).tolist() == [key in d for key in keys]
+
+    def test_chunks(self):
+        d = IntDAWG().load(os.path.join(FIXTURES_DIR, "int.dawg"))
+        keys = self.words[:100] + self.missing
+        res = VectorLookup(d, chunk_size=7).values(keys, default=0)
+        assert res.tolist() == [d.get(key, 0) for key in keys]
+
+    def test_empty(self):
+        d = IntDAWG().load(os.path.join(FIXTURES_DIR, "int.dawg"))
+        assert VectorLookup(d).values([]).tolist() == []
+
+
+class TestColumnar:
+    def dawg(self):
+        return RecordDAWG(">3H").load(os.path.join(FIXTURES_DIR, "record.dawg"))
+
+    def test_items_columnar(self):
+        d = self.dawg()
+        keys, columns = vectorized.items_columnar(d)
+        expected_keys, expected_columns = d.items_columnar()
+        assert keys == expected_keys
+        assert [column.tolist() for column in columns] == [list(c) for c in expected_columns]
+        assert vectorized.items_columnar(d, "x")[1][0].tolist() == []
+
+    def test_get_many_columnar(self):
+        d = self.dawg()
+        keys = ["foo", "x", "foobar"]
+        offsets, columns = vectorized.get_many_columnar(d, keys)
+        expected_offsets, expected_columns = d.get_many_columnar(keys)
+        assert offsets.tolist() == list(expected_offsets)
+        assert [column.tolist() for column in columns] == [list(c) for c in expected_columns]
+
+    @pytest.mark.parametrize("fmt", [">3H", "<2xi10sH?", "@bidc", ">qQef", "!hB", "bxi"])
+    def test_record_dtype(self, fmt):
+        import struct
+
+        data = bytes(range(1, struct.calcsize(fmt) + 1))
+        record = np.frombuffer(data, dtype=vectorized.record_dtype(fmt))[0]
+        assert record.tolist() == struct.unpack(fmt, data)
+
+    def test_record_dtype_unsupported(self):
+        with pytest.raises(ValueError):
+            vectorized.record_dtype("5p")
@@ -1,3 +1,6 @@
+import contextlib
+import inspect
+import sys
 import zipfile
 
 
@@ -6,3 +9,14 @@ def words100k():
     zf = zipfile.ZipFile(zip_name)
     txt = zf.open(zf.namelist()[0]).read().decode("utf8")
     return txt.splitlines()
+
+
+@contextlib.contextmanager
+def shallow_stack(frames=50):
+    "Allows only ``frames`` more Python frames than the caller has."
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(len(inspect.stack()) + frames)
+    try:
+        yield
+    finally:
+        sys.setrecursionlimit(limit)